@@ -9,7 +9,29 @@ from PyQt6.QtGui import QPixmap, QPainter, QFont, QColor, QLinearGradient
 from PyQt6.QtCore import Qt
 
 
+# Cached rendering of the splash screen; bump the version when the design changes
+SPLASH_CACHE_NAME = "splash_v1_500x350.png"
+
+
 def _create_splash_pixmap():
+    """Load the cached splash image, or paint it and cache it for next launch."""
+    from .models import get_cache_dir
+
+    cache_path = os.path.join(get_cache_dir(), SPLASH_CACHE_NAME)
+    pixmap = QPixmap()
+    if pixmap.load(cache_path, "PNG"):
+        return pixmap
+
+    pixmap = _paint_splash_pixmap()
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        pixmap.save(cache_path, "PNG")
+    except OSError:
+        pass  # Painting again next launch is fine
+    return pixmap
+
+
+def _paint_splash_pixmap():
     """Create splash pixmap inline to avoid module import delay."""
     width, height = 500, 350
     pixmap = QPixmap(width, height)
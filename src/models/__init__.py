@@ -1,6 +1,6 @@
 """Models package."""
 
-from .settings import Settings, get_settings_path, get_config_dir
+from .settings import Settings, get_settings_path, get_config_dir, get_cache_dir
 from .liturgy import (
     # V2 classes (new)
     SectionType,
@@ -35,6 +35,7 @@ __all__ = [
     "Settings",
     "get_settings_path",
     "get_config_dir",
+    "get_cache_dir",
     # V2 classes (new)
     "SectionType",
     "LiturgySlide",
@@ -46,6 +46,25 @@ def get_config_dir() -> str:
     return config_dir
 
 
+def get_cache_dir() -> str:
+    """Get the directory for cached data that can be regenerated at any time.
+
+    Windows: %LOCALAPPDATA%/LiturgieSamensteller/Cache
+    macOS: ~/Library/Caches/LiturgieSamensteller
+    Linux: ~/.cache/LiturgieSamensteller
+
+    The directory is not created here; callers create it when writing.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", os.environ.get("APPDATA", os.path.expanduser("~")))
+        return os.path.join(base, APP_NAME, "Cache")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache"))
+    return os.path.join(base, APP_NAME)
+
+
 def get_settings_path() -> str:
     """Get the full path to the settings file."""
     return os.path.join(get_config_dir(), "settings.json")
@@ -2,18 +2,25 @@
 
 from .folder_scanner import FolderScanner
 from .pptx_service import PptxService, PptxSection, SlideField
+from .thumbnail_cache import ThumbnailDiskCache
 from .youtube_service import YouTubeService, YouTubeResult
 from .export_service import ExportService
 from .theme_service import ThemeService
 from .excel_service import ExcelService
 from .pptx_scanner_service import PptxScannerService, PptxScanResult
-from .song_matcher import normalize_for_search, fuzzy_match_score, find_best_matches
+from .song_matcher import (
+    normalize_for_search,
+    fuzzy_match_score,
+    fuzzy_match_normalized,
+    find_best_matches,
+)
 
 __all__ = [
     "FolderScanner",
     "PptxService",
     "PptxSection",
     "SlideField",
+    "ThumbnailDiskCache",
     "YouTubeService",
     "YouTubeResult",
     "ExportService",
@@ -23,5 +30,6 @@ __all__ = [
     "PptxScanResult",
     "normalize_for_search",
     "fuzzy_match_score",
+    "fuzzy_match_normalized",
     "find_best_matches",
 ]
@@ -5,6 +5,7 @@ import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 from typing import List, Optional, Tuple, Dict, Any
 from dataclasses import dataclass, field
@@ -14,6 +15,7 @@ from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 
 from ..logging_config import get_logger
+from .thumbnail_cache import ThumbnailDiskCache
 
 logger = get_logger("pptx_service")
 
@@ -30,6 +32,10 @@ from ..models import (
     SectionType,
 )
 
+# Slide exports share one PowerPoint instance, which each export quits when
+# done; exports from background threads must therefore not overlap.
+_COM_EXPORT_LOCK = threading.Lock()
+
 
 @dataclass
 class PptxSection:
@@ -52,9 +58,16 @@ class SlideField:
 class PptxService:
     """Service for creating and manipulating PowerPoint presentations."""
 
-    def __init__(self, settings: Settings, base_path: str = "."):
+    def __init__(self, settings: Settings, base_path: str = ".", cache_presentations: bool = False):
         self.settings = settings
         self.base_path = base_path
+        self._thumbnail_cache = ThumbnailDiskCache()
+        # Keep the last read presentation open; only for short-lived services
+        # that query one file repeatedly, as a deck can take tens of MB
+        self._cache_presentations = cache_presentations
+        # Most recently read presentation: (path, mtime, Presentation)
+        self._presentation_cache: Optional[Tuple[str, float, Any]] = None
+        self._presentation_lock = threading.Lock()
 
     def merge_liturgy(self, liturgy: Liturgy) -> str:
         """
@@ -836,13 +849,35 @@ class PptxService:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
         shutil.move(temp_path, output_path)
 
+    def _get_presentation(self, pptx_path: str):
+        """Open a presentation for reading, reusing the last one if unchanged.
+
+        The presentation is only kept when the service was created with
+        cache_presentations. Callers must hold self._presentation_lock while
+        using the result and must not modify it.
+        """
+        if not self._cache_presentations:
+            return Presentation(pptx_path)
+        mtime = os.path.getmtime(pptx_path)
+        cached = self._presentation_cache
+        if cached and cached[0] == pptx_path and cached[1] == mtime:
+            return cached[2]
+        prs = Presentation(pptx_path)
+        self._presentation_cache = (pptx_path, mtime, prs)
+        return prs
+
+    def clear_presentation_cache(self) -> None:
+        """Release the cached presentation (file data and parsed XML)."""
+        with self._presentation_lock:
+            self._presentation_cache = None
+
     def get_slide_count(self, pptx_path: str) -> int:
         """Get the number of slides in a presentation."""
         if not os.path.exists(pptx_path):
             return 0
         try:
-            prs = Presentation(pptx_path)
-            return len(prs.slides)
+            with self._presentation_lock:
+                return len(self._get_presentation(pptx_path).slides)
         except Exception:
             return 0
 
@@ -868,7 +903,7 @@ class PptxService:
         """Get a thumbnail image for a specific slide.
 
         Uses PowerPoint COM automation on Windows to export the slide as an image.
-        Results are cached to avoid repeated exports.
+        Results are cached on disk (across sessions) to avoid repeated exports.
 
         Args:
             pptx_path: Path to the PowerPoint file
@@ -880,33 +915,27 @@ class PptxService:
         if not os.path.exists(pptx_path):
             return None
 
-        # Create cache directory
-        cache_dir = os.path.join(tempfile.gettempdir(), "pptx_thumbnails")
-        os.makedirs(cache_dir, exist_ok=True)
-
-        # Generate cache key based on file path, modification time, and slide index
-        file_stat = os.stat(pptx_path)
-        cache_key = f"{os.path.basename(pptx_path)}_{file_stat.st_mtime}_{slide_index}_{width}"
-        # Create a safe filename from the cache key
-        import hashlib
-        cache_filename = hashlib.md5(cache_key.encode()).hexdigest() + ".png"
-        cache_path = os.path.join(cache_dir, cache_filename)
-
-        # Check if cached thumbnail exists
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, 'rb') as f:
-                    return f.read()
-            except Exception:
-                pass
+        # Check if a cached thumbnail exists
+        thumb_data = self._thumbnail_cache.get(pptx_path, slide_index, width)
+        if thumb_data:
+            return thumb_data
 
         # Try to generate thumbnail using PowerPoint COM
+        export_path = tempfile.mktemp(suffix=".png")
         try:
-            thumb_data = self._export_slide_with_com(pptx_path, slide_index, cache_path, width)
+            with _COM_EXPORT_LOCK:
+                thumb_data = self._export_slide_with_com(pptx_path, slide_index, export_path, width)
             if thumb_data:
+                self._thumbnail_cache.put(pptx_path, slide_index, thumb_data, width)
                 return thumb_data
         except Exception:
             pass
+        finally:
+            try:
+                if os.path.exists(export_path):
+                    os.remove(export_path)
+            except OSError:
+                pass  # Still locked by PowerPoint; left in the temp folder
 
         # Fallback: return the presentation thumbnail (first slide only)
         if slide_index == 0:
@@ -995,24 +1024,38 @@ class PptxService:
 
         return None
 
+    def get_slide_preview(self, pptx_path: str, slide_index: int,
+                          width: int = 240) -> Tuple[Optional[bytes], str]:
+        """Get both the thumbnail image and the preview text of a slide.
+
+        Convenience for background workers that show a full slide preview.
+
+        Returns (image bytes or None, preview text).
+        """
+        return (
+            self.get_slide_thumbnail(pptx_path, slide_index, width),
+            self.get_slide_thumbnail_text(pptx_path, slide_index),
+        )
+
     def get_slide_thumbnail_text(self, pptx_path: str, slide_index: int) -> str:
         """Get a text representation of a slide (title + first paragraph)."""
         if not os.path.exists(pptx_path):
             return ""
         try:
-            prs = Presentation(pptx_path)
-            if slide_index < len(prs.slides):
-                slide = prs.slides[slide_index]
-                texts = []
-                if slide.shapes.title:
-                    texts.append(self._clean_title(slide.shapes.title.text))
-                for shape in slide.shapes:
-                    if shape.has_text_frame and shape != slide.shapes.title:
-                        text = self._clean_title(shape.text_frame.text)
-                        if text:
-                            texts.append(text[:100])
-                            break
-                return "\n".join(texts)
+            with self._presentation_lock:
+                prs = self._get_presentation(pptx_path)
+                if slide_index < len(prs.slides):
+                    slide = prs.slides[slide_index]
+                    texts = []
+                    if slide.shapes.title:
+                        texts.append(self._clean_title(slide.shapes.title.text))
+                    for shape in slide.shapes:
+                        if shape.has_text_frame and shape != slide.shapes.title:
+                            text = self._clean_title(shape.text_frame.text)
+                            if text:
+                                texts.append(text[:100])
+                                break
+                    return "\n".join(texts)
         except Exception:
             pass
         return ""
@@ -1119,23 +1162,24 @@ class PptxService:
             return []
 
         try:
-            prs = Presentation(pptx_path)
             slides_info = []
 
-            for idx, slide in enumerate(prs.slides):
-                # Get slide title
-                title = ""
-                if slide.shapes.title:
-                    title = self._clean_title(slide.shapes.title.text)
+            with self._presentation_lock:
+                prs = self._get_presentation(pptx_path)
+                for idx, slide in enumerate(prs.slides):
+                    # Get slide title
+                    title = ""
+                    if slide.shapes.title:
+                        title = self._clean_title(slide.shapes.title.text)
 
-                # Extract fields
-                fields = self.extract_fields_from_slide(slide)
+                    # Extract fields
+                    fields = self.extract_fields_from_slide(slide)
 
-                slides_info.append({
-                    "index": idx,
-                    "title": title or f"Slide {idx + 1}",
-                    "fields": fields,
-                })
+                    slides_info.append({
+                        "index": idx,
+                        "title": title or f"Slide {idx + 1}",
+                        "fields": fields,
+                    })
 
             return slides_info
 
@@ -1242,15 +1286,16 @@ class PptxService:
             return []
 
         try:
-            prs = Presentation(pptx_path)
             all_fields = []
 
-            if slide_index is not None:
-                if 0 <= slide_index < len(prs.slides):
-                    all_fields = self.extract_fields_from_slide(prs.slides[slide_index])
-            else:
-                for slide in prs.slides:
-                    all_fields.extend(self.extract_fields_from_slide(slide))
+            with self._presentation_lock:
+                prs = self._get_presentation(pptx_path)
+                if slide_index is not None:
+                    if 0 <= slide_index < len(prs.slides):
+                        all_fields = self.extract_fields_from_slide(prs.slides[slide_index])
+                else:
+                    for slide in prs.slides:
+                        all_fields.extend(self.extract_fields_from_slide(slide))
 
             return all_fields
 
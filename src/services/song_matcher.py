@@ -2,11 +2,74 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Tuple
 
 from ..models import Song
 
 
+# Multi-character replacements (order matters - do longer patterns first)
+_MULTI_CHAR_REPLACEMENTS = (
+    ('sch', 's'),      # German/Dutch sch → s
+    ('gh', 'g'),       # Arabic transliteration
+    ('ch', 'k'),       # Christ → Krist
+    ('ph', 'f'),       # Pharao → Farao
+    ('th', 't'),       # Thomas → Tomas
+    ('oe', 'u'),       # Dutch oe → u sound
+    ('ou', 'u'),       # French/Dutch ou → u
+    ('ee', 'i'),       # ee → i (Geest → Gist)
+    ('ie', 'i'),       # ie → i
+    ('ei', 'y'),       # Dutch ei → y
+    ('ij', 'y'),       # Dutch ij → y
+    ('aa', 'a'),       # Double vowels → single
+    ('oo', 'o'),
+    ('uu', 'u'),
+)
+
+# Single character replacements, plus removal of all other ASCII characters
+# that are not a-z or 0-9, done in one translate pass
+_CHAR_MAP = str.maketrans({
+    **{
+        chr(code): None
+        for code in range(128)
+        if not (chr(code).isdigit() or 'a' <= chr(code) <= 'z')
+    },
+    'j': 'y',          # j → y (Dutch j sounds like English y)
+    'c': 'k',          # c → k
+    'q': 'k',          # q → k
+    'x': 'ks',         # x → ks
+    'z': 's',          # z → s (soften)
+    'v': 'f',          # v → f (Dutch v often sounds like f)
+    'w': 'v',          # w → v (German w)
+})
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+
+def _strip_marks(char: str) -> str:
+    """Remove combining marks from a character's canonical decomposition."""
+    return ''.join(
+        c for c in unicodedata.normalize('NFD', char)
+        if unicodedata.category(c) != 'Mn'
+    )
+
+
+# Accented Latin-1 and Latin Extended-A letters mapped to their base letters,
+# so common diacritics are removed in one translate pass instead of NFD
+_DIACRITIC_MAP = str.maketrans({
+    **{
+        chr(code): _strip_marks(chr(code))
+        for code in range(0xC0, 0x180)
+        if _strip_marks(chr(code)) != chr(code)
+    },
+    'ß': 'ss',
+    'æ': 'ae',
+    'œ': 'oe',
+    'ø': 'o',
+})
+
+
+@lru_cache(maxsize=4096)
 def normalize_for_search(text: str) -> str:
     """Normalize text for fuzzy multilingual search.
 
@@ -18,50 +81,29 @@ def normalize_for_search(text: str) -> str:
     - ei ↔ ij ↔ y (Dutch)
     - ph ↔ f, th ↔ t
     - sch ↔ s
-    - Removes diacritics (é→e, ü→u, etc.)
+    - Removes diacritics (é→e, ü→u, etc.) and splits ligatures (æ→ae, ß→ss)
+
+    Results are cached: song titles and the queries typed against them
+    are normalized over and over while searching.
     """
     # Lowercase
     text = text.lower()
 
-    # Remove diacritics (é→e, ü→u, ñ→n, etc.)
-    text = unicodedata.normalize('NFD', text)
-    text = ''.join(c for c in text if unicodedata.category(c) != 'Mn')
-
-    # Multi-character replacements (order matters - do longer patterns first)
-    replacements = [
-        ('sch', 's'),      # German/Dutch sch → s
-        ('gh', 'g'),       # Arabic transliteration
-        ('ch', 'k'),       # Christ → Krist
-        ('ph', 'f'),       # Pharao → Farao
-        ('th', 't'),       # Thomas → Tomas
-        ('oe', 'u'),       # Dutch oe → u sound
-        ('ou', 'u'),       # French/Dutch ou → u
-        ('ee', 'i'),       # ee → i (Geest → Gist)
-        ('ie', 'i'),       # ie → i
-        ('ei', 'y'),       # Dutch ei → y
-        ('ij', 'y'),       # Dutch ij → y
-        ('aa', 'a'),       # Double vowels → single
-        ('oo', 'o'),
-        ('uu', 'u'),
-    ]
-
-    for old, new in replacements:
+    # Remove diacritics (é→e, ü→u, ñ→n, etc.); plain ASCII has none.
+    # Common Latin letters go through the table, anything else through NFD.
+    if not text.isascii():
+        text = text.translate(_DIACRITIC_MAP)
+        if not text.isascii():
+            text = _strip_marks(text)
+
+    for old, new in _MULTI_CHAR_REPLACEMENTS:
         text = text.replace(old, new)
 
-    # Single character replacements
-    char_map = str.maketrans({
-        'j': 'y',          # j → y (Dutch j sounds like English y)
-        'c': 'k',          # c → k
-        'q': 'k',          # q → k
-        'x': 'ks',         # x → ks
-        'z': 's',          # z → s (soften)
-        'v': 'f',          # v → f (Dutch v often sounds like f)
-        'w': 'v',          # w → v (German w)
-    })
-    text = text.translate(char_map)
-
-    # Remove non-alphanumeric
-    text = re.sub(r'[^a-z0-9]', '', text)
+    text = text.translate(_CHAR_MAP)
+
+    # Remove remaining non-alphanumeric characters (only non-ASCII ones are left)
+    if not text.isascii():
+        text = _NON_ALNUM_RE.sub('', text)
 
     return text
 
@@ -74,37 +116,49 @@ def fuzzy_match_score(query: str, text: str) -> float:
     """
     if not query:
         return 1.0
+    return fuzzy_match_normalized(normalize_for_search(query), normalize_for_search(text))
 
-    query_norm = normalize_for_search(query)
-    text_norm = normalize_for_search(text)
 
+def fuzzy_match_normalized(query_norm: str, text_norm: str) -> float:
+    """Calculate the fuzzy match score for already normalized query and text.
+
+    Callers that match one query against many texts can normalize each
+    side once with normalize_for_search and use this directly.
+    """
     if not query_norm:
         return 1.0
 
-    # Exact normalized substring match - best score
-    if query_norm in text_norm:
+    # Prefix match - best score; substring match - next best. Both are
+    # C-level checks, so most real queries never reach the scan below.
+    if text_norm.startswith(query_norm):
         return 1.0
+    if query_norm in text_norm:
+        return 0.95
 
     # Check if all query characters appear in order (subsequence match)
-    # This handles typos and partial matches
-    query_idx = 0
+    # This handles typos and partial matches. Each query character is looked
+    # up with str.find from just after the previous match, which is the same
+    # greedy scan as walking the text but runs in C.
+    find = text_norm.find
     matches = 0
     last_match_pos = -1
     consecutive_bonus = 0
 
-    for i, char in enumerate(text_norm):
-        if query_idx < len(query_norm) and char == query_norm[query_idx]:
-            matches += 1
-            # Bonus for consecutive matches
-            if last_match_pos == i - 1:
-                consecutive_bonus += 0.1
-            last_match_pos = i
-            query_idx += 1
+    for char in query_norm:
+        pos = find(char, last_match_pos + 1)
+        if pos < 0:
+            break
+        matches += 1
+        # Bonus for consecutive matches
+        if pos == last_match_pos + 1:
+            consecutive_bonus += 0.1
+        last_match_pos = pos
 
     if matches == len(query_norm):
-        # All characters found in order - good match
+        # All characters found in order - good match, but never better
+        # than an actual substring
         base_score = 0.6
-        score = min(1.0, base_score + consecutive_bonus)
+        score = min(0.9, base_score + consecutive_bonus)
         return score
 
     # Partial match - some characters found
@@ -118,11 +172,12 @@ def find_best_matches(
     query: str, songs: List[Song], limit: int = 3
 ) -> List[Tuple[Song, float]]:
     """Return up to `limit` (song, score) pairs, sorted descending by score."""
+    query_norm = normalize_for_search(query)
     scored = []
     for song in songs:
         score = max(
-            fuzzy_match_score(query, song.display_title),
-            fuzzy_match_score(query, song.name),
+            fuzzy_match_normalized(query_norm, normalize_for_search(song.display_title)),
+            fuzzy_match_normalized(query_norm, normalize_for_search(song.name)),
         )
         if score > 0:
             scored.append((song, score))
@@ -3,7 +3,7 @@
 import os
 import shutil
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from pptx import Presentation
 
@@ -24,6 +24,8 @@ class ThemeService:
         self.settings = settings
         self.base_path = base_path
         self.pptx_service = PptxService(settings, base_path)
+        # Section outline per theme file: path -> (mtime, outline)
+        self._outline_cache: Dict[str, Tuple[float, List[Tuple[str, List[Tuple[int, str]]]]]] = {}
 
     def load_as_liturgy(self, pptx_path: str, name: Optional[str] = None) -> Liturgy:
         """
@@ -159,45 +161,52 @@ class ThemeService:
         if not os.path.exists(pptx_path):
             return []
 
+        # Build new objects on every call; callers add them to a liturgy
+        sections = []
+        for section_name, slides in self._get_theme_outline(pptx_path):
+            section = LiturgySection(
+                name=section_name,
+                section_type=SectionType.REGULAR,
+                source_theme_path=pptx_path,
+            )
+            for slide_index, title in slides:
+                section.slides.append(LiturgySlide(
+                    title=title,
+                    slide_index=slide_index,
+                    source_path=pptx_path,
+                ))
+            sections.append(section)
+
+        return sections
+
+    def _get_theme_outline(self, pptx_path: str) -> List[Tuple[str, List[Tuple[int, str]]]]:
+        """
+        Get the section names with their (slide index, title) pairs.
+        The outline is read once and reused while the file is unchanged.
+        """
+        mtime = os.path.getmtime(pptx_path)
+        cached = self._outline_cache.get(pptx_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
         pptx_sections = self.pptx_service.get_sections(pptx_path)
         slides_info = self.pptx_service.get_slides_info(pptx_path)
 
-        sections = []
+        outline = []
 
         if len(pptx_sections) == 1 and pptx_sections[0].name == "All Slides":
             # No sections defined, create one section per slide
             for slide_info in slides_info:
-                section = LiturgySection(
-                    name=slide_info["title"],
-                    section_type=SectionType.REGULAR,
-                    source_theme_path=pptx_path,
-                )
-                slide = LiturgySlide(
-                    title=slide_info["title"],
-                    slide_index=slide_info["index"],
-                    source_path=pptx_path,
-                )
-                section.slides.append(slide)
-                sections.append(section)
+                outline.append((slide_info["title"], [(slide_info["index"], slide_info["title"])]))
         else:
             for pptx_section in pptx_sections:
-                section = LiturgySection(
-                    name=pptx_section.name,
-                    section_type=SectionType.REGULAR,
-                    source_theme_path=pptx_path,
-                )
-
-                for slide_idx in pptx_section.slide_indices:
-                    if slide_idx < len(slides_info):
-                        slide_info = slides_info[slide_idx]
-                        slide = LiturgySlide(
-                            title=slide_info["title"],
-                            slide_index=slide_idx,
-                            source_path=pptx_path,
-                        )
-                        section.slides.append(slide)
-
-                if section.slides:
-                    sections.append(section)
-
-        return sections
+                slides = [
+                    (slide_idx, slides_info[slide_idx]["title"])
+                    for slide_idx in pptx_section.slide_indices
+                    if slide_idx < len(slides_info)
+                ]
+                if slides:
+                    outline.append((pptx_section.name, slides))
+
+        self._outline_cache[pptx_path] = (mtime, outline)
+        return outline
@@ -0,0 +1,84 @@
+"""Persistent on-disk cache for slide thumbnail images."""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional, Tuple
+
+from ..models import get_cache_dir
+from ..logging_config import get_logger
+
+logger = get_logger("thumbnail_cache")
+
+# Serializes writes, so one writer never removes another's new version folder;
+# shared by all instances, as every PptxService has its own cache object
+_CACHE_WRITE_LOCK = threading.Lock()
+
+
+class ThumbnailDiskCache:
+    """Stores slide thumbnails as PNG files across application sessions.
+
+    Layout: <cache_dir>/<sha1 of pptx path>/<pptx mtime>/<slide_index>_<width>.png
+
+    Thumbnails of an older version of a presentation live under a different
+    mtime folder; those folders are removed when the new version is cached.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir or os.path.join(get_cache_dir(), "thumbnails")
+
+    def _get_dirs(self, pptx_path: str) -> Optional[Tuple[str, str]]:
+        """Get (presentation folder, version folder), or None if the file is missing."""
+        try:
+            mtime = os.stat(pptx_path).st_mtime_ns
+        except OSError:
+            return None
+        path_hash = hashlib.sha1(os.path.abspath(pptx_path).encode("utf-8")).hexdigest()
+        file_dir = os.path.join(self.cache_dir, path_hash)
+        return file_dir, os.path.join(file_dir, str(mtime))
+
+    def get(self, pptx_path: str, slide_index: int, width: int = 240) -> Optional[bytes]:
+        """Get a cached thumbnail, or None if it is not cached."""
+        dirs = self._get_dirs(pptx_path)
+        if not dirs:
+            return None
+        try:
+            with open(os.path.join(dirs[1], f"{slide_index}_{width}.png"), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def put(self, pptx_path: str, slide_index: int, data: bytes, width: int = 240) -> None:
+        """Store a thumbnail in the cache."""
+        dirs = self._get_dirs(pptx_path)
+        if not dirs:
+            return
+        file_dir, version_dir = dirs
+        try:
+            with _CACHE_WRITE_LOCK:
+                if not os.path.isdir(version_dir):
+                    self._remove_old_versions(file_dir, keep=os.path.basename(version_dir))
+                    os.makedirs(version_dir, exist_ok=True)
+
+                # Write to a temp file first so readers never see a partial image
+                fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=version_dir)
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(data)
+                    os.replace(temp_path, os.path.join(version_dir, f"{slide_index}_{width}.png"))
+                except Exception:
+                    os.remove(temp_path)
+                    raise
+        except OSError as e:
+            logger.warning(f"Could not cache thumbnail for {pptx_path}[{slide_index}]: {e}")
+
+    def _remove_old_versions(self, file_dir: str, keep: str) -> None:
+        """Remove thumbnails cached for older versions of a presentation."""
+        if not os.path.isdir(file_dir):
+            return
+        for name in os.listdir(file_dir):
+            if name == keep:
+                continue  # Created by a concurrent put for the current version
+            shutil.rmtree(os.path.join(file_dir, name), ignore_errors=True)
@@ -5,7 +5,9 @@ import re
 import subprocess
 import sys
 import json
-from typing import List, Optional, Tuple
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -31,8 +33,23 @@ class YouTubeService:
         r"(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([a-zA-Z0-9_-]{11})"
     )
 
+    # How long link validation results are reused within a session (seconds)
+    LINK_CACHE_TTL = 15 * 60
+
+    # Errors that will not go away on a retry; other failures (offline,
+    # timeouts, unexpected yt-dlp output) are never cached
+    DEFINITIVE_LINK_ERRORS = frozenset({
+        "Invalid YouTube URL",
+        "Video unavailable",
+        "Private video",
+        "Video removed",
+    })
+
     def __init__(self):
         self._yt_dlp_available = None
+        # (link key, thorough) -> (timestamp, is_valid, error_message)
+        self._link_cache: Dict[Tuple[str, bool], Tuple[float, bool, Optional[str]]] = {}
+        self._link_cache_lock = threading.Lock()
 
     def _get_yt_dlp_cmd(self) -> List[str]:
         """Get the command to run yt-dlp as a Python module."""
@@ -182,20 +199,40 @@ class YouTubeService:
             return False, str(e)
 
     def validate_links_batch(
-        self, urls: List[str], thorough: bool = False
+        self, urls: List[str], thorough: bool = False, use_cache: bool = True
     ) -> List[Tuple[str, bool, Optional[str]]]:
         """
         Validate multiple links in parallel.
+        Definitive results (valid links and permanent errors) are cached per
+        video for LINK_CACHE_TTL seconds; with use_cache=False every link is
+        checked again.
         Returns list of (url, is_valid, error_message) tuples.
         """
         results = []
+        to_check = []
+
+        if use_cache:
+            now = time.monotonic()
+            with self._link_cache_lock:
+                for url in urls:
+                    cached = self._link_cache.get((self.get_link_key(url), thorough))
+                    if cached and now - cached[0] < self.LINK_CACHE_TTL:
+                        results.append((url, cached[1], cached[2]))
+                    else:
+                        to_check.append(url)
+        else:
+            to_check = list(urls)
+
+        if not to_check:
+            return results
 
         validate_func = (
             self.validate_link_thorough if thorough else self._validate_fast_wrapper
         )
 
+        checked = []
         with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(validate_func, url): url for url in urls}
+            futures = {executor.submit(validate_func, url): url for url in to_check}
 
             for future in as_completed(futures):
                 url = futures[future]
@@ -205,12 +242,27 @@ class YouTubeService:
                         is_valid, error = result
                     else:
                         is_valid, error = result, None
-                    results.append((url, is_valid, error))
+                    checked.append((url, is_valid, error))
                 except Exception as e:
-                    results.append((url, False, str(e)))
+                    checked.append((url, False, str(e)))
 
+        now = time.monotonic()
+        with self._link_cache_lock:
+            for url, is_valid, error in checked:
+                if is_valid or error in self.DEFINITIVE_LINK_ERRORS:
+                    self._link_cache[(self.get_link_key(url), thorough)] = (now, is_valid, error)
+
+        results.extend(checked)
         return results
 
+    def get_link_key(self, url: str) -> str:
+        """Get a normalized key for a link, used to detect duplicates.
+
+        YouTube links resolve to their video ID (which is case-sensitive);
+        other links are stripped of whitespace and a trailing slash.
+        """
+        return self.extract_video_id(url) or url.strip().rstrip("/")
+
     def _validate_fast_wrapper(self, url: str) -> Tuple[bool, Optional[str]]:
         """Wrapper to make fast validation return same format as thorough."""
         is_valid = self.validate_link_fast(url)
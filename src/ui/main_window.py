@@ -2,7 +2,7 @@
 
 import os
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
 from PyQt6.QtWidgets import (
     QMainWindow,
@@ -26,7 +26,7 @@ from PyQt6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
 )
-from PyQt6.QtCore import Qt, QSize, QDate
+from PyQt6.QtCore import Qt, QSize, QDate, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QAction, QKeySequence
 
 from ..models import (
@@ -61,6 +61,31 @@ from .about_dialog import AboutDialog
 from .bible_picker import BiblePickerDialog
 
 
+class LinkCheckSignals(QObject):
+    """Signals for link check worker."""
+    finished = pyqtSignal(list, int)  # (url, is_valid, error) tuples, request_id
+
+
+class LinkCheckRunnable(QRunnable):
+    """Runnable for validating YouTube links in background."""
+
+    def __init__(self, youtube_service: YouTubeService, urls: List[str], request_id: int):
+        super().__init__()
+        self.youtube_service = youtube_service
+        self.urls = urls
+        self.request_id = request_id
+        self.signals = LinkCheckSignals()
+
+    def run(self):
+        """Validate the links (fast mode) in background."""
+        try:
+            results = self.youtube_service.validate_links_batch(self.urls, thorough=False)
+        except Exception as e:
+            logger.error(f"Background link check failed: {e}", exc_info=True)
+            results = []
+        self.signals.finished.emit(results, self.request_id)
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -84,6 +109,10 @@ class MainWindow(QMainWindow):
         self.theme_service = ThemeService(self.settings, base_path)
         self.pptx_service = PptxService(self.settings, base_path)
 
+        # Background link checking
+        self._link_check_runnable: Optional[LinkCheckRunnable] = None
+        self._link_check_request_id = 0
+
         # Set language from settings
         set_language(self.settings.language)
 
@@ -716,7 +745,13 @@ class MainWindow(QMainWindow):
 
     def _on_add_from_theme(self) -> None:
         """Add sections/slides from a theme file."""
-        dialog = ThemeSectionPicker(self.settings, self.base_path, self.liturgy.sections, self)
+        dialog = ThemeSectionPicker(
+            self.settings,
+            self.base_path,
+            self.liturgy.sections,
+            theme_service=self.theme_service,
+            parent=self,
+        )
         if dialog.exec():
             sections = dialog.get_selected_sections()
             insert_idx = self._get_insertion_index()
@@ -1213,17 +1248,14 @@ class MainWindow(QMainWindow):
         self.statusbar.repaint()
 
         # Collect all YouTube URLs
-        urls = []
-        for item in self.liturgy.items:
-            if isinstance(item, SongLiturgyItem):
-                urls.extend(item.youtube_links)
+        urls = self._collect_unique_urls()
 
         if not urls:
             self.status_label.setText(tr("status.links_valid"))
             return
 
-        # Validate (thorough)
-        results = self.youtube_service.validate_links_batch(urls, thorough=True)
+        # Validate (thorough); an explicit check never reuses earlier results
+        results = self.youtube_service.validate_links_batch(urls, thorough=True, use_cache=False)
         invalid_count = sum(1 for _, valid, _ in results if not valid)
 
         if invalid_count > 0:
@@ -1232,19 +1264,41 @@ class MainWindow(QMainWindow):
         else:
             self.status_label.setText(tr("status.links_valid"))
 
-    def _check_links_background(self) -> None:
-        """Check links in background (fast mode)."""
-        # Simplified fast check
+    def _collect_unique_urls(self) -> List[str]:
+        """Collect the YouTube URLs of all songs, without duplicates."""
+        seen = set()
         urls = []
         for item in self.liturgy.items:
             if isinstance(item, SongLiturgyItem):
-                urls.extend(item.youtube_links)
+                for url in item.youtube_links:
+                    key = self.youtube_service.get_link_key(url)
+                    if key not in seen:
+                        seen.add(key)
+                        urls.append(url)
+        return urls
+
+    def _check_links_background(self) -> None:
+        """Check links in background (fast mode)."""
+        # Simplified fast check
+        urls = self._collect_unique_urls()
 
         if urls:
-            results = self.youtube_service.validate_links_batch(urls, thorough=False)
-            invalid_count = sum(1 for _, valid, _ in results if not valid)
-            if invalid_count > 0:
-                self.status_label.setText(tr("status.links_invalid", count=invalid_count))
+            # Results from an earlier (now stale) check are ignored
+            self._link_check_request_id += 1
+            runnable = LinkCheckRunnable(self.youtube_service, urls, self._link_check_request_id)
+            runnable.signals.finished.connect(self._on_background_links_checked)
+            self._link_check_runnable = runnable
+            QThreadPool.globalInstance().start(runnable)
+
+    def _on_background_links_checked(self, results: list, request_id: int) -> None:
+        """Handle results of the background link check."""
+        if request_id != self._link_check_request_id:
+            return
+        self._link_check_runnable = None
+
+        invalid_count = sum(1 for _, valid, _ in results if not valid)
+        if invalid_count > 0:
+            self.status_label.setText(tr("status.links_invalid", count=invalid_count))
 
     def _on_import_pptx(self) -> None:
         """Open the Import from PPTX archive dialog."""
@@ -1256,17 +1310,33 @@ class MainWindow(QMainWindow):
         """Open settings dialog."""
         dialog = SettingsDialog(self.settings, self.base_path, self)
         if dialog.exec():
+            old_settings = self.settings
             self.settings = dialog.get_settings()
             self.settings.save()
-            # Reinitialize services with new settings and refresh folder scanner
-            self.folder_scanner = FolderScanner(self.settings, self.base_path)
-            self.folder_scanner.refresh()  # Force rescan with new settings
+            # Only rescan the folders if a setting they depend on changed
+            if self._settings_changed(
+                old_settings, "base_folder", "songs_folder", "algemeen_folder",
+                "collecte_filename", "stub_template_filename", "bible_template_filename",
+            ):
+                self.folder_scanner = FolderScanner(self.settings, self.base_path)
+            else:
+                self.folder_scanner.settings = self.settings  # Keep scanned caches
             self.export_service = ExportService(self.settings, self.base_path)
-            self.theme_service = ThemeService(self.settings, self.base_path)
-            # Refresh dienstleider autocomplete
-            self._setup_dienstleider_autocomplete()
-            # Recheck warnings (offering file may have changed)
-            self._check_warnings()
+            # Theme outlines are cached by file path and mtime, so keep them
+            self.theme_service.settings = self.settings
+            self.theme_service.pptx_service.settings = self.settings
+            # Refresh dienstleider autocomplete if the Excel register moved
+            if self._settings_changed(old_settings, "base_folder", "excel_register_path"):
+                self._setup_dienstleider_autocomplete()
+            # Recheck warnings if the offering file may have changed
+            if self._settings_changed(
+                old_settings, "base_folder", "algemeen_folder", "collecte_filename"
+            ):
+                self._check_warnings()
+
+    def _settings_changed(self, old_settings: Settings, *names: str) -> bool:
+        """Check whether any of the named settings differ from old_settings."""
+        return any(getattr(old_settings, name) != getattr(self.settings, name) for name in names)
 
     def _on_open_theme(self) -> None:
         """Open a theme template as liturgy."""
@@ -27,6 +27,9 @@ from ..logging_config import get_logger
 
 logger = get_logger("new_song_dialog")
 
+# Matches Windows (\r\n) and old Mac (\r) line endings
+_CR_RE = re.compile(r'\r\n?')
+
 
 class LyricsSearchWorker(QThread):
     """Background worker that searches lyrics.ovh for song suggestions."""
@@ -336,7 +339,8 @@ class NewSongDialog(QDialog):
         lyrics = lyrics.replace('\u2028', '\n')    # Line separator -> newline
         lyrics = lyrics.replace('\v', '\n')        # Vertical tab -> newline
         lyrics = lyrics.replace('\f', '\n\n')      # Form feed -> blank line
-        lyrics = lyrics.replace('\r\n', '\n').replace('\r', '\n')
+        if '\r' in lyrics:
+            lyrics = _CR_RE.sub('\n', lyrics)  # One pass for \r\n and \r
 
         # Remove trailing whitespace from each line
         lines = [line.rstrip() for line in lyrics.split('\n')]
@@ -416,9 +420,9 @@ class NewSongDialog(QDialog):
 
     def _create_pptx(self, title: str, lyrics: str, output_path: str) -> None:
         """Create a PowerPoint presentation from lyrics."""
+        import copy
         from pptx import Presentation
-        from pptx.util import Inches, Pt
-        from pptx.enum.text import PP_ALIGN
+        from pptx.util import Inches
 
         # Create presentation
         prs = Presentation()
@@ -431,42 +435,66 @@ class NewSongDialog(QDialog):
         # Split lyrics into slides
         slides_text = self._split_lyrics(lyrics)
 
+        # The text boxes are built and styled once on the first slide; every
+        # following slide gets a copy of their XML instead of new shapes.
+        templates = None
+
         for slide_text in slides_text:
             slide = prs.slides.add_slide(blank_layout)
 
-            # Add title text box at top
-            title_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(0.3),
-                Inches(12.333), Inches(0.8)
-            )
-            title_frame = title_box.text_frame
-            title_para = title_frame.paragraphs[0]
-            title_para.text = title
-            title_para.font.size = Pt(28)
-            title_para.font.bold = True
-            title_para.alignment = PP_ALIGN.CENTER
-
-            # Add lyrics text box
-            lyrics_box = slide.shapes.add_textbox(
-                Inches(0.5), Inches(1.5),
-                Inches(12.333), Inches(5.5)
-            )
-            lyrics_frame = lyrics_box.text_frame
-            lyrics_frame.word_wrap = True
-
-            # Add lyrics text - each line as a separate paragraph
+            if templates is None:
+                title_box, lyrics_box = self._add_text_boxes(slide, title)
+                templates = (
+                    copy.deepcopy(title_box._element),
+                    copy.deepcopy(lyrics_box._element),
+                )
+            else:
+                sp_tree = slide.shapes._spTree
+                for element in templates:
+                    sp_tree.append(copy.deepcopy(element))
+
+            # Add lyrics text - each line as a separate paragraph, cloned
+            # from the styled (empty) first paragraph of the lyrics box
+            lyrics_frame = slide.shapes[1].text_frame
+            paragraph_template = copy.deepcopy(lyrics_frame.paragraphs[0]._p)
             lines = slide_text.split('\n')
-            for i, line in enumerate(lines):
-                if i == 0:
-                    lyrics_para = lyrics_frame.paragraphs[0]
-                else:
-                    lyrics_para = lyrics_frame.add_paragraph()
-                lyrics_para.text = line
-                lyrics_para.font.size = Pt(32)
-                lyrics_para.alignment = PP_ALIGN.CENTER
+            lyrics_frame.paragraphs[0].text = lines[0]
+            for line in lines[1:]:
+                lyrics_frame._txBody.append(copy.deepcopy(paragraph_template))
+                lyrics_frame.paragraphs[-1].text = line
 
         prs.save(output_path)
 
+    def _add_text_boxes(self, slide, title: str) -> tuple:
+        """Add the styled title and (empty) lyrics text boxes to a slide."""
+        from pptx.util import Inches, Pt
+        from pptx.enum.text import PP_ALIGN
+
+        # Add title text box at top
+        title_box = slide.shapes.add_textbox(
+            Inches(0.5), Inches(0.3),
+            Inches(12.333), Inches(0.8)
+        )
+        title_frame = title_box.text_frame
+        title_para = title_frame.paragraphs[0]
+        title_para.text = title
+        title_para.font.size = Pt(28)
+        title_para.font.bold = True
+        title_para.alignment = PP_ALIGN.CENTER
+
+        # Add lyrics text box
+        lyrics_box = slide.shapes.add_textbox(
+            Inches(0.5), Inches(1.5),
+            Inches(12.333), Inches(5.5)
+        )
+        lyrics_frame = lyrics_box.text_frame
+        lyrics_frame.word_wrap = True
+        lyrics_para = lyrics_frame.paragraphs[0]
+        lyrics_para.font.size = Pt(32)
+        lyrics_para.alignment = PP_ALIGN.CENTER
+
+        return title_box, lyrics_box
+
     def get_created_folder(self) -> Optional[str]:
         """Get the path to the created song folder."""
         return self._created_folder
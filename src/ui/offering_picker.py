@@ -1,6 +1,7 @@
 """Dialog for selecting a slide from the Offering (Collecte) PowerPoint."""
 
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog,
@@ -18,8 +19,8 @@ from PyQt6.QtWidgets import (
     QInputDialog,
     QFrame,
 )
-from PyQt6.QtCore import Qt, QRunnable, QThreadPool, pyqtSignal, QObject
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal, QObject
+from PyQt6.QtGui import QColor, QImage, QPainter, QPixmap, QPixmapCache
 
 from ..models import OfferingSlide, OfferingLiturgyItem, Settings
 from ..services import PptxService, FolderScanner
@@ -28,22 +29,42 @@ from ..logging_config import get_logger
 
 logger = get_logger("offering_picker")
 
+# Suffix of QPixmapCache keys for quickly scaled (prefetched) thumbnails
+FAST_SCALED_SUFFIX = ":fast"
+
+# Delay (ms) before loading a thumbnail, so fast keyboard navigation
+# only loads the slide the user stops on
+THUMBNAIL_LOAD_DELAY = 120
+
+# Offsets (in list order) of neighbouring slides to prefetch, nearest first
+PREFETCH_OFFSETS = (1, -1, 2, -2)
+
 
 class ThumbnailSignals(QObject):
-    """Signals for thumbnail worker."""
-    finished = pyqtSignal(int, bytes)  # slide_index, image_data
-    error = pyqtSignal(int)  # slide_index
+    """Signals for thumbnail workers (one instance is shared by many runnables)."""
+    finished = pyqtSignal(str, int, QImage, str)  # pptx_path, slide_index, scaled image (may be null), preview text
+    error = pyqtSignal(str, int)  # pptx_path, slide_index
 
 
 class ThumbnailRunnable(QRunnable):
-    """Runnable for loading slide thumbnails in background."""
+    """Runnable for loading slide thumbnails and preview text in background.
+
+    The image is decoded and scaled here as a QImage (which, unlike QPixmap,
+    may be used outside the GUI thread), so the GUI thread only has to
+    convert it to a pixmap.
+    """
 
-    def __init__(self, pptx_service: PptxService, pptx_path: str, slide_index: int):
+    def __init__(self, pptx_service: PptxService, signals: ThumbnailSignals,
+                 pptx_path: str, slide_index: int, target_size: QSize,
+                 pixel_ratio: float = 1.0, smooth: bool = True):
         super().__init__()
         self.pptx_service = pptx_service
+        self.signals = signals
         self.pptx_path = pptx_path
         self.slide_index = slide_index
-        self.signals = ThumbnailSignals()
+        self.target_size = target_size
+        self.pixel_ratio = pixel_ratio
+        self.smooth = smooth
         self._cancelled = False
 
     def cancel(self):
@@ -51,22 +72,48 @@ class ThumbnailRunnable(QRunnable):
         self._cancelled = True
 
     def run(self):
-        """Load the thumbnail in background."""
+        """Load the thumbnail and preview text in background."""
         if self._cancelled:
             return
         try:
-            thumb_data = self.pptx_service.get_slide_thumbnail(
+            thumb_data, preview_text = self.pptx_service.get_slide_preview(
                 self.pptx_path, self.slide_index
             )
             if self._cancelled:
                 return
-            if thumb_data:
-                self.signals.finished.emit(self.slide_index, thumb_data)
-            else:
-                self.signals.error.emit(self.slide_index)
+            image = QImage()
+            if thumb_data and image.loadFromData(thumb_data):
+                image = image.scaled(
+                    self.target_size * self.pixel_ratio,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation if self.smooth
+                    else Qt.TransformationMode.FastTransformation
+                )
+                image.setDevicePixelRatio(self.pixel_ratio)
+            self.signals.finished.emit(self.pptx_path, self.slide_index, image, preview_text)
         except Exception:
             if not self._cancelled:
-                self.signals.error.emit(self.slide_index)
+                self.signals.error.emit(self.pptx_path, self.slide_index)
+
+
+class SlideScanSignals(QObject):
+    """Signals for slide scan worker."""
+    finished = pyqtSignal(str, list)  # pptx_path, list of OfferingSlide
+
+
+class SlideScanRunnable(QRunnable):
+    """Runnable for reading the slide titles of an offerings file in background."""
+
+    def __init__(self, folder_scanner: FolderScanner, pptx_path: str):
+        super().__init__()
+        self.folder_scanner = folder_scanner
+        self.pptx_path = pptx_path
+        self.signals = SlideScanSignals()
+
+    def run(self):
+        """Scan the slides in background."""
+        slides = self.folder_scanner.get_offering_slides(self.pptx_path)
+        self.signals.finished.emit(self.pptx_path, slides)
 
 
 class OfferingPickerDialog(QDialog):
@@ -79,20 +126,52 @@ class OfferingPickerDialog(QDialog):
         self.settings = settings
         self.base_path = base_path
         self.folder_scanner = folder_scanner
+        self._default_pptx_path = settings.get_collecte_path(base_path)
         self._selected_slide: Optional[OfferingSlide] = None
-        self._pptx_service = PptxService(settings, base_path)
+        self._pptx_service: Optional[PptxService] = None  # Created on first thumbnail load
         self._custom_pptx_path: Optional[str] = None
         self._stub_title: Optional[str] = None
 
-        # Background thumbnail loading
+        # Background thumbnail loading; all runnables report through these
+        # signals (one for the selected slide, one for prefetches)
         self._thread_pool = QThreadPool.globalInstance()
+        self._thumb_signals = ThumbnailSignals()
+        self._prefetch_signals = ThumbnailSignals()
         self._current_runnable: Optional[ThumbnailRunnable] = None
         self._loading_slide_index: Optional[int] = None
+        self._loading_cache_key: Optional[str] = None
+        self._pending_pptx_path: Optional[str] = None
+        self._thumb_load_timer = QTimer(self)
+        self._thumb_load_timer.setSingleShot(True)
+        self._thumb_load_timer.setInterval(THUMBNAIL_LOAD_DELAY)
+        self._thumb_load_timer.timeout.connect(self._start_thumbnail_load)
+
+        # Preview texts by (pptx_path, slide_index)
+        self._preview_text_cache: Dict[Tuple[str, int], str] = {}
+
+        # Low-priority loads of neighbouring slides: slide index -> (runnable, pptx_path, cache key)
+        self._prefetch_runnables: Dict[int, Tuple[ThumbnailRunnable, str, str]] = {}
+
+        # Background scan of a browsed offerings file
+        self._slide_scan_runnable: Optional[SlideScanRunnable] = None
+
+        # Lowercase item texts and hidden state (in row order) for searching
+        self._search_texts: List[str] = []
+        self._hidden_rows: List[bool] = []
+
+        # The list is filled when the dialog is first shown
+        self._initialized = False
 
         self._setup_ui()
-        self._populate_list()
         self._connect_signals()
 
+    def showEvent(self, event) -> None:
+        """Populate the list the first time the dialog is shown."""
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            self._populate_list()
+
     def _setup_ui(self) -> None:
         """Setup the dialog UI."""
         self.setWindowTitle(tr("dialog.offering.title"))
@@ -118,6 +197,7 @@ class OfferingPickerDialog(QDialog):
         # Slide list
         self.list_widget = QListWidget()
         self.list_widget.setAlternatingRowColors(True)
+        self.list_widget.setUniformItemSizes(True)  # All rows are single-line text
         layout.addWidget(self.list_widget)
 
         # Preview area with thumbnail
@@ -175,13 +255,23 @@ class OfferingPickerDialog(QDialog):
 
     def _populate_list(self) -> None:
         """Populate the list with Offering slides."""
-        self.list_widget.clear()
+        self._search_texts = []
+        self._hidden_rows = [False] * len(self.slides)
 
-        for slide in self.slides:
-            list_item = QListWidgetItem()
-            list_item.setText(f"{slide.index + 1}. {slide.title}")
-            list_item.setData(Qt.ItemDataRole.UserRole, slide)
-            self.list_widget.addItem(list_item)
+        # Fill the list in one batch, without a repaint per item
+        self.list_widget.setUpdatesEnabled(False)
+        self.list_widget.blockSignals(True)
+        try:
+            self.list_widget.clear()
+            for slide in self.slides:
+                list_item = QListWidgetItem()
+                list_item.setText(f"{slide.index + 1}. {slide.title}")
+                list_item.setData(Qt.ItemDataRole.UserRole, slide)
+                self.list_widget.addItem(list_item)
+                self._search_texts.append(list_item.text().lower())
+        finally:
+            self.list_widget.blockSignals(False)
+            self.list_widget.setUpdatesEnabled(True)
 
     def _connect_signals(self) -> None:
         """Connect widget signals."""
@@ -190,50 +280,82 @@ class OfferingPickerDialog(QDialog):
         self.list_widget.itemDoubleClicked.connect(self._on_double_click)
         self.browse_button.clicked.connect(self._on_browse_file)
         self.stub_button.clicked.connect(self._on_create_stub)
+        self._thumb_signals.finished.connect(self._on_thumbnail_loaded)
+        self._thumb_signals.error.connect(self._on_thumbnail_error)
+        self._prefetch_signals.finished.connect(self._on_thumbnail_prefetched)
+        self._prefetch_signals.error.connect(self._on_prefetch_error)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
     def _on_search_text_changed(self, text: str) -> None:
         """Filter list items based on search text."""
         search_lower = text.lower()
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            matches = search_lower in item.text().lower()
-            item.setHidden(not matches)
+        hidden_rows = self._hidden_rows
+
+        # Apply all visibility changes with a single relayout/repaint
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for i, item_text in enumerate(self._search_texts):
+                hidden = search_lower not in item_text
+                if hidden != hidden_rows[i]:  # Only touch rows whose state changes
+                    self.list_widget.item(i).setHidden(hidden)
+                    hidden_rows[i] = hidden
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
 
     def _on_selection_changed(self) -> None:
         """Handle selection change in list."""
         selected_items = self.list_widget.selectedItems()
 
         if selected_items:
-            item = selected_items[0]
-            self._selected_slide = item.data(Qt.ItemDataRole.UserRole)
+            slide = selected_items[0].data(Qt.ItemDataRole.UserRole)
+            if slide is self._selected_slide and not self._custom_pptx_path and not self._stub_title:
+                return  # Same slide as before; preview is already up to date
+            self._selected_slide = slide
             self._custom_pptx_path = None
             self._stub_title = None
             self._update_preview()
             self.status_label.clear()
         else:
             self._selected_slide = None
-            self.preview_text.clear()
+            self._reset_preview()
 
         self._update_ok_button()
 
+    def _clear_selection(self) -> None:
+        """Clear the list selection without triggering a preview update."""
+        self.list_widget.blockSignals(True)
+        self.list_widget.clearSelection()
+        self.list_widget.blockSignals(False)
+        self._reset_preview()
+
+    def _reset_preview(self) -> None:
+        """Clear preview text and thumbnail without starting a thumbnail load."""
+        self._cancel_thumbnail_load()
+        self.preview_text.clear()
+        self.thumbnail_label.setPixmap(QPixmap())
+
     def _update_preview(self) -> None:
         """Update preview with slide content and thumbnail."""
         if self._selected_slide:
-            pptx_path = self._custom_pptx_path or self.settings.get_collecte_path(self.base_path)
-            preview_text = self._pptx_service.get_slide_thumbnail_text(
-                pptx_path, self._selected_slide.index
-            )
-            self.preview_text.setText(preview_text if preview_text else tr("dialog.offering.no_text"))
+            pptx_path = self._custom_pptx_path or self._default_pptx_path
+            preview_text = self._preview_text_cache.get((pptx_path, self._selected_slide.index))
+            if preview_text is not None:
+                self._show_preview_text(preview_text)
+            else:
+                self.preview_text.clear()  # Filled in by the thumbnail worker
 
             # Update thumbnail
             self._update_thumbnail(pptx_path)
         else:
             self.thumbnail_label.setPixmap(QPixmap())
 
+    def _show_preview_text(self, preview_text: str) -> None:
+        """Show the preview text of the selected slide."""
+        self.preview_text.setText(preview_text if preview_text else tr("dialog.offering.no_text"))
+
     def _update_thumbnail(self, pptx_path: str) -> None:
-        """Update the thumbnail preview for the selected slide (async)."""
+        """Update the thumbnail and preview text for the selected slide (async)."""
         if not self._selected_slide:
             self.thumbnail_label.setPixmap(QPixmap())
             return
@@ -243,48 +365,198 @@ class OfferingPickerDialog(QDialog):
         # Cancel any existing thumbnail load
         self._cancel_thumbnail_load()
 
-        # Show loading indicator
-        self.thumbnail_label.setText("...")
+        # Show cached thumbnail without reloading it
+        cache_key = self._thumbnail_cache_key(pptx_path, slide_index)
+        cached, smooth = self._find_cached_thumbnail(cache_key) if cache_key else (None, False)
+        if cached is not None:
+            self.thumbnail_label.setPixmap(cached)
+            self._prefetch(pptx_path, slide_index)
+            if smooth and (pptx_path, slide_index) in self._preview_text_cache:
+                return
+            # Replace a quickly scaled (prefetched) thumbnail with a smooth
+            # one, or load the missing preview text, once the selection settles
+            self._loading_slide_index = slide_index
+            self._loading_cache_key = cache_key
+            self._pending_pptx_path = pptx_path
+            self._thumb_load_timer.start()
+            return
+
+        # Show a placeholder; the actual load starts once selection settles
+        self.thumbnail_label.setPixmap(self._make_placeholder(self._selected_slide))
         self._loading_slide_index = slide_index
+        self._loading_cache_key = cache_key
+        self._pending_pptx_path = pptx_path
+        self._thumb_load_timer.start()
+
+    def _make_placeholder(self, slide: OfferingSlide) -> QPixmap:
+        """Create a placeholder thumbnail showing the slide title."""
+        pixel_ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.thumbnail_label.size() * pixel_ratio)
+        pixmap.setDevicePixelRatio(pixel_ratio)
+        pixmap.fill(QColor("#f0f0f0"))
+
+        painter = QPainter(pixmap)
+        painter.setPen(QColor("#808080"))
+        painter.drawText(
+            self.thumbnail_label.rect().adjusted(4, 4, -4, -4),
+            Qt.AlignmentFlag.AlignCenter | Qt.TextFlag.TextWordWrap,
+            slide.title[:24]
+        )
+        painter.end()
+        return pixmap
+
+    def _start_thumbnail_load(self) -> None:
+        """Start loading the pending thumbnail in the thread pool."""
+        if self._loading_slide_index is None or not self._pending_pptx_path:
+            return
 
         # Start background loading using thread pool
-        runnable = ThumbnailRunnable(self._pptx_service, pptx_path, slide_index)
-        runnable.signals.finished.connect(self._on_thumbnail_loaded)
-        runnable.signals.error.connect(self._on_thumbnail_error)
+        runnable = self._create_thumbnail_runnable(
+            self._thumb_signals, self._pending_pptx_path, self._loading_slide_index
+        )
         self._current_runnable = runnable
         self._thread_pool.start(runnable)
 
     def _cancel_thumbnail_load(self) -> None:
-        """Cancel any in-progress thumbnail loading."""
+        """Cancel any pending or in-progress thumbnail loading."""
+        self._thumb_load_timer.stop()
+        self._pending_pptx_path = None
         if self._current_runnable:
             self._current_runnable.cancel()
         self._current_runnable = None
         self._loading_slide_index = None
+        self._loading_cache_key = None
 
-    def _on_thumbnail_loaded(self, slide_index: int, thumb_data: bytes) -> None:
-        """Handle thumbnail loaded from background thread."""
+    def _thumbnail_cache_key(self, pptx_path: str, slide_index: int) -> Optional[str]:
+        """Get the QPixmapCache key for a slide thumbnail, or None if the file is missing."""
+        try:
+            mtime = os.path.getmtime(pptx_path)
+        except OSError:
+            return None
+        return f"offering:{pptx_path}:{mtime}:{slide_index}"
+
+    @staticmethod
+    def _find_cached_thumbnail(cache_key: str) -> Tuple[Optional[QPixmap], bool]:
+        """Find a cached thumbnail, preferring a smoothly scaled one.
+
+        Returns:
+            Tuple of (pixmap or None, whether the pixmap is smoothly scaled)
+        """
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            return pixmap, True
+        return QPixmapCache.find(cache_key + FAST_SCALED_SUFFIX), False
+
+    def _get_pptx_service(self) -> PptxService:
+        """Get the PowerPoint service, creating it on first use."""
+        if self._pptx_service is None:
+            # Thumbnails of one offering deck are read slide after slide
+            self._pptx_service = PptxService(self.settings, self.base_path, cache_presentations=True)
+        return self._pptx_service
+
+    def _create_thumbnail_runnable(self, signals: ThumbnailSignals, pptx_path: str,
+                                   slide_index: int, smooth: bool = True) -> ThumbnailRunnable:
+        """Create a runnable that loads a thumbnail scaled to the thumbnail label."""
+        return ThumbnailRunnable(
+            self._get_pptx_service(), signals, pptx_path, slide_index,
+            self.thumbnail_label.size(), self.devicePixelRatioF(), smooth
+        )
+
+    def _on_thumbnail_loaded(self, pptx_path: str, slide_index: int, image: QImage,
+                             preview_text: str) -> None:
+        """Handle thumbnail and preview text loaded from background thread."""
         # Only update if this is still the slide we're waiting for
-        if self._loading_slide_index != slide_index:
+        if self._loading_slide_index != slide_index or self._pending_pptx_path != pptx_path:
             return
 
-        pixmap = QPixmap()
-        pixmap.loadFromData(thumb_data)
-        if not pixmap.isNull():
-            scaled = pixmap.scaled(
-                self.thumbnail_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.thumbnail_label.setPixmap(scaled)
-        else:
+        self._preview_text_cache[(pptx_path, slide_index)] = preview_text
+        self._show_preview_text(preview_text)
+
+        if image.isNull():
             self.thumbnail_label.setPixmap(QPixmap())
+        else:
+            pixmap = QPixmap.fromImage(image)
+            self.thumbnail_label.setPixmap(pixmap)
+            if self._loading_cache_key:
+                self._cache_thumbnail(self._loading_cache_key, pixmap)
+                self._prefetch(pptx_path, slide_index)
 
         self._loading_slide_index = None
+        self._loading_cache_key = None
+
+    @staticmethod
+    def _cache_thumbnail(cache_key: str, pixmap: QPixmap, smooth: bool = True) -> None:
+        """Store a scaled thumbnail in the application-wide pixmap cache."""
+        if smooth:
+            QPixmapCache.insert(cache_key, pixmap)
+            QPixmapCache.remove(cache_key + FAST_SCALED_SUFFIX)
+        else:
+            QPixmapCache.insert(cache_key + FAST_SCALED_SUFFIX, pixmap)
+
+    def _prefetch(self, pptx_path: str, center_index: int) -> None:
+        """Load thumbnails of the slides around center_index into the cache."""
+        positions = {slide.index: pos for pos, slide in enumerate(self.slides)}
+        center_pos = positions.get(center_index)
+        if center_pos is None:
+            return
 
-    def _on_thumbnail_error(self, slide_index: int) -> None:
+        wanted = []
+        for offset in PREFETCH_OFFSETS:
+            pos = center_pos + offset
+            if 0 <= pos < len(self.slides):
+                wanted.append(self.slides[pos].index)
+
+        # Drop prefetches for slides that are no longer near the selection
+        for slide_index in list(self._prefetch_runnables):
+            if slide_index not in wanted:
+                self._prefetch_runnables.pop(slide_index)[0].cancel()
+
+        for slide_index in wanted:
+            cache_key = self._thumbnail_cache_key(pptx_path, slide_index)
+            if (
+                not cache_key
+                or slide_index in self._prefetch_runnables
+                or (self._find_cached_thumbnail(cache_key)[0] is not None
+                    and (pptx_path, slide_index) in self._preview_text_cache)
+            ):
+                continue
+            # Prefetched thumbnails may never be shown, so scale them quickly
+            runnable = self._create_thumbnail_runnable(
+                self._prefetch_signals, pptx_path, slide_index, smooth=False
+            )
+            self._prefetch_runnables[slide_index] = (runnable, pptx_path, cache_key)
+            # Lower priority than loads for the selected slide
+            self._thread_pool.start(runnable, -1)
+
+    def _cancel_prefetch(self) -> None:
+        """Cancel all outstanding prefetches."""
+        for runnable, _, _ in self._prefetch_runnables.values():
+            runnable.cancel()
+        self._prefetch_runnables.clear()
+
+    def _on_thumbnail_prefetched(self, pptx_path: str, slide_index: int, image: QImage,
+                                 preview_text: str) -> None:
+        """Store a prefetched thumbnail and text in the caches (without displaying them)."""
+        entry = self._prefetch_runnables.get(slide_index)
+        if entry is None or entry[1] != pptx_path:
+            return
+        del self._prefetch_runnables[slide_index]
+        cache_key = entry[2]
+        self._preview_text_cache[(pptx_path, slide_index)] = preview_text
+        if not image.isNull():
+            self._cache_thumbnail(cache_key, QPixmap.fromImage(image), smooth=False)
+
+    def _on_prefetch_error(self, pptx_path: str, slide_index: int) -> None:
+        """Forget a prefetch that failed."""
+        entry = self._prefetch_runnables.get(slide_index)
+        if entry is not None and entry[1] == pptx_path:
+            del self._prefetch_runnables[slide_index]
+
+    def _on_thumbnail_error(self, pptx_path: str, slide_index: int) -> None:
         """Handle thumbnail load error."""
-        if self._loading_slide_index == slide_index:
+        if self._loading_slide_index == slide_index and self._pending_pptx_path == pptx_path:
             self.thumbnail_label.setPixmap(QPixmap())
+            self._show_preview_text("")
             self._loading_slide_index = None
 
     def _on_double_click(self, item: QListWidgetItem) -> None:
@@ -305,31 +577,37 @@ class OfferingPickerDialog(QDialog):
 
         if file_path:
             self._custom_pptx_path = file_path
+            self._preview_text_cache.clear()
             self._selected_slide = None
             self._stub_title = None
-            self.list_widget.clearSelection()
+            self._clear_selection()
+            self._update_ok_button()
 
-            # Load slides from the new file
-            if self.folder_scanner:
-                new_slides = self.folder_scanner.get_offering_slides(file_path)
-            else:
-                # Fallback: create temporary scanner
-                from ..services import FolderScanner
-                temp_scanner = FolderScanner(self.settings, self.base_path)
-                new_slides = temp_scanner.get_offering_slides(file_path)
-
-            if new_slides:
-                self.slides = new_slides
-                self._populate_list()
-
-                import os
-                filename = os.path.basename(file_path)
-                self.status_label.setText(tr("dialog.offering.external_loaded", filename=filename))
-            else:
-                self.status_label.setText(tr("dialog.offering.no_slides_found"))
+            # Load slides from the new file in background
+            scanner = self.folder_scanner or FolderScanner(self.settings, self.base_path)
+            runnable = SlideScanRunnable(scanner, file_path)
+            runnable.signals.finished.connect(self._on_slides_scanned)
+            self._slide_scan_runnable = runnable
+            self.status_label.setText(
+                tr("dialog.offering.loading", filename=os.path.basename(file_path))
+            )
+            self._thread_pool.start(runnable)
 
-            self.preview_text.clear()
-            self._update_ok_button()
+    def _on_slides_scanned(self, pptx_path: str, new_slides: List[OfferingSlide]) -> None:
+        """Show the slides of a browsed offerings file once they are scanned."""
+        self._slide_scan_runnable = None
+        # Ignore the result if another file, slide or stub was chosen meanwhile
+        if pptx_path != self._custom_pptx_path:
+            return
+
+        if new_slides:
+            self.slides = new_slides
+            self._populate_list()
+            self.status_label.setText(
+                tr("dialog.offering.external_loaded", filename=os.path.basename(pptx_path))
+            )
+        else:
+            self.status_label.setText(tr("dialog.offering.no_slides_found"))
 
     def _on_create_stub(self) -> None:
         """Open dialog to create a stub offering slide."""
@@ -343,10 +621,9 @@ class OfferingPickerDialog(QDialog):
             self._stub_title = title.strip()
             self._selected_slide = None
             self._custom_pptx_path = None
-            self.list_widget.clearSelection()
+            self._clear_selection()
 
             self.status_label.setText(tr("dialog.offering.stub_selected", title=self._stub_title))
-            self.preview_text.clear()
             self._update_ok_button()
 
     def _update_ok_button(self) -> None:
@@ -367,7 +644,7 @@ class OfferingPickerDialog(QDialog):
 
         if self._selected_slide:
             # Always provide actual path (custom or default offering file)
-            actual_pptx_path = self._custom_pptx_path or self.settings.get_collecte_path(self.base_path)
+            actual_pptx_path = self._custom_pptx_path or self._default_pptx_path
             import os
             logger.debug(f"Creating offering item: pptx_path={actual_pptx_path!r}, exists={os.path.exists(actual_pptx_path) if actual_pptx_path else False}")
             return OfferingLiturgyItem(
@@ -388,6 +665,9 @@ class OfferingPickerDialog(QDialog):
     def closeEvent(self, event) -> None:
         """Clean up background thread on close."""
         self._cancel_thumbnail_load()
+        self._cancel_prefetch()
+        if self._pptx_service:
+            self._pptx_service.clear_presentation_cache()
         super().closeEvent(event)
 
 
@@ -1,9 +1,11 @@
 """Unified editor dialog for sections with tabs for fields and YouTube."""
 
 import os
-import subprocess
-import sys
-from typing import Dict, List, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog,
@@ -11,8 +13,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QTabWidget,
     QWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QLineEdit,
     QPushButton,
     QLabel,
@@ -23,16 +24,35 @@ from PyQt6.QtWidgets import (
     QListWidget,
     QListWidgetItem,
     QProgressBar,
-    QSizePolicy,
     QStyledItemDelegate,
     QPlainTextEdit,
+    QStyle,
+    QStyleOptionButton,
+    QStyleOptionViewItem,
+    QToolTip,
+    QApplication,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QUrl, QModelIndex
+from PyQt6.QtCore import (
+    Qt, QAbstractTableModel, QEvent, QObject, QRect, QRunnable, QSize, QThreadPool, QTimer,
+    pyqtSignal, QUrl, QModelIndex,
+)
+from PyQt6.QtGui import QPainter
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 from ..models import LiturgySection, LiturgySlide
 from ..services import PptxService, YouTubeService, YouTubeResult, SlideField
 from ..i18n import tr
+from .workers import PipInstallRunnable, SearchRunnable, YtDlpInstallMixin
+
+
+# Delay (ms) that collapses repeated search requests into one search
+SEARCH_DEBOUNCE_MS = 250
+
+# Runs of characters that are not allowed in custom field names
+_FIELD_SANITIZER = re.compile(r"\W+")
+
+# Number of top search results whose audio URL is resolved ahead of a preview
+AUDIO_PREFETCH_COUNT = 3
 
 
 class MultiLineDelegate(QStyledItemDelegate):
@@ -62,115 +82,369 @@ class MultiLineDelegate(QStyledItemDelegate):
         editor.setGeometry(rect)
 
 
-class SearchWorker(QThread):
-    """Worker thread for YouTube search."""
+# Fields found in source slides by (pptx_path, mtime_ns, slide_index), shared
+# by all editor dialogs. A changed file gets a new key, so entries never go stale.
+_fields_cache: Dict[Tuple[str, int, int], List[SlideField]] = {}
+_fields_cache_lock = threading.Lock()
+
+
+def _fields_cache_key(pptx_path: str, slide_index: int) -> Optional[Tuple[str, int, int]]:
+    """Get the fields cache key for a slide, or None if the file is missing."""
+    try:
+        return (pptx_path, os.stat(pptx_path).st_mtime_ns, slide_index)
+    except OSError:
+        return None
+
+
+def _get_cached_fields(pptx_path: str, slide_index: int) -> Optional[List[SlideField]]:
+    """Get the cached fields of a slide, or None if they still need to be extracted."""
+    key = _fields_cache_key(pptx_path, slide_index)
+    if key is None:
+        return []  # Missing file: nothing to extract
+    with _fields_cache_lock:
+        cached = _fields_cache.get(key)
+    return list(cached) if cached is not None else None
+
 
-    finished = pyqtSignal(list)
-    error = pyqtSignal(str)
+def _extract_fields_cached(pptx_service: PptxService, pptx_path: str,
+                           slide_index: int) -> List[SlideField]:
+    """Get the fields of a slide, parsing the presentation only once per version."""
+    key = _fields_cache_key(pptx_path, slide_index)
+    if key is None:
+        return []
+    with _fields_cache_lock:
+        cached = _fields_cache.get(key)
+    if cached is None:
+        cached = pptx_service.extract_fields(pptx_path, slide_index)
+        with _fields_cache_lock:
+            _fields_cache[key] = cached
+    return list(cached)
 
-    def __init__(self, youtube_service: YouTubeService, query: str):
+
+class FieldExtractSignals(QObject):
+    """Signals for field extraction worker."""
+    finished = pyqtSignal(list)  # list of SlideField
+
+
+class FieldExtractRunnable(QRunnable):
+    """Runnable for extracting the available fields of a slide in background."""
+
+    def __init__(self, pptx_service: PptxService, pptx_path: str, slide_index: int):
         super().__init__()
-        self.youtube_service = youtube_service
-        self.query = query
+        self.pptx_service = pptx_service
+        self.pptx_path = pptx_path
+        self.slide_index = slide_index
+        self.signals = FieldExtractSignals()
 
     def run(self):
         try:
-            results = self.youtube_service.search(self.query, max_results=10)
-            self.finished.emit(results)
-        except Exception as e:
-            self.error.emit(str(e))
+            fields = _extract_fields_cached(self.pptx_service, self.pptx_path, self.slide_index)
+        except Exception:
+            fields = []
+        self.signals.finished.emit(fields)
+
+
+# Thread pool for YouTube searches and audio URL extraction (created on first use)
+_youtube_thread_pool: Optional[QThreadPool] = None
+
 
+def _get_youtube_thread_pool() -> QThreadPool:
+    """Get the thread pool shared by all YouTube workers of the section editor."""
+    global _youtube_thread_pool
+    if _youtube_thread_pool is None:
+        _youtube_thread_pool = QThreadPool()
+        _youtube_thread_pool.setMaxThreadCount(2)
+    return _youtube_thread_pool
 
-class AudioUrlWorker(QThread):
-    """Worker thread to extract audio URL from YouTube."""
 
+# Single thread for audio URL prefetches, so they never occupy both threads
+# of the YouTube pool (created on first use)
+_audio_prefetch_thread_pool: Optional[QThreadPool] = None
+
+
+def _get_audio_prefetch_thread_pool() -> QThreadPool:
+    """Get the thread pool that resolves audio URLs ahead of a preview."""
+    global _audio_prefetch_thread_pool
+    if _audio_prefetch_thread_pool is None:
+        _audio_prefetch_thread_pool = QThreadPool()
+        _audio_prefetch_thread_pool.setMaxThreadCount(1)
+    return _audio_prefetch_thread_pool
+
+
+class FieldsModel(QAbstractTableModel):
+    """Table model of slide fields: a read-only name column and an editable value column."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._values: List[str] = []
+        self._headers = [tr("dialog.fields.field_name"), tr("dialog.fields.value")]
+
+    def set_fields(self, fields: Dict[str, str]) -> None:
+        """Replace all rows with the given fields."""
+        self.beginResetModel()
+        self._names = list(fields.keys())
+        self._values = list(fields.values())
+        self.endResetModel()
+
+    def add_field(self, name: str, value: str = "") -> None:
+        """Append a field row."""
+        row = len(self._names)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._names.append(name)
+        self._values.append(value)
+        self.endInsertRows()
+
+    def get_fields(self) -> List[Tuple[str, str]]:
+        """Get all (name, value) pairs in row order."""
+        return list(zip(self._names, self._values))
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._names)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else 2
+
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        column = self._names if index.column() == 0 else self._values
+        return column[index.row()]
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 1:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or index.column() != 1 or role != Qt.ItemDataRole.EditRole:
+            return False
+        self._values[index.row()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+
+# Shared yt-dlp instance for audio URL extraction (created on first use).
+# A YoutubeDL instance is not thread-safe, so it is only used under the lock.
+_youtube_dl: Any = None
+_youtube_dl_lock = threading.Lock()
+
+
+def _get_youtube_dl() -> Any:
+    """Get the shared YoutubeDL instance. Caller must hold _youtube_dl_lock."""
+    global _youtube_dl
+    if _youtube_dl is None:
+        import yt_dlp  # Imported lazily: optional dependency that may be installed at runtime
+        _youtube_dl = yt_dlp.YoutubeDL({
+            "quiet": True,
+            "no_warnings": True,
+            # Audio only; prefer a single m4a file over fragmented streams
+            "format": "bestaudio[ext=m4a]/bestaudio",
+            "noplaylist": True,
+            "check_formats": False,
+            "skip_download": True,
+            "extract_flat": False,
+            "socket_timeout": 10,
+        })
+    return _youtube_dl
+
+
+def _warm_up_youtube_dl() -> None:
+    """Import yt-dlp and create the shared YoutubeDL instance ahead of the first preview."""
+    try:
+        with _youtube_dl_lock:
+            _get_youtube_dl()
+    except Exception:
+        pass  # Not installed (yet); the preview reports the error when used
+
+
+def _select_audio_url(info: Dict[str, Any]) -> Optional[str]:
+    """Get the stream URL of the best audio-only format from yt-dlp video info."""
+    if info.get("url"):
+        return info["url"]  # Format already selected by yt-dlp
+    audio_formats = [
+        f for f in info.get("formats") or []
+        if f.get("url") and f.get("acodec") != "none" and f.get("vcodec") == "none"
+    ]
+    if not audio_formats:
+        return None
+    return max(audio_formats, key=lambda f: f.get("abr") or 0)["url"]
+
+
+class AudioUrlSignals(QObject):
+    """Signals for audio URL worker."""
     finished = pyqtSignal(str, str)  # url, audio_url
     error = pyqtSignal(str, str)  # url, error_message
 
+
+class AudioUrlRunnable(QRunnable):
+    """Runnable to extract audio URL from YouTube in background."""
+
+    # Resolved audio URLs by video ID, least recently used first. YouTube
+    # stream URLs stay valid for about six hours.
+    URL_CACHE_TTL = 5 * 60 * 60
+    URL_CACHE_SIZE = 64
+    _url_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # key -> (audio_url, timestamp)
+    _url_cache_lock = threading.Lock()
+
     def __init__(self, url: str):
         super().__init__()
         self.url = url
+        self.signals = AudioUrlSignals()
+        self.cancelled = False
+
+    @staticmethod
+    def _cache_key(url: str) -> str:
+        """Get the cache key for a URL (the video ID for YouTube links)."""
+        match = YouTubeService.YOUTUBE_REGEX.search(url)
+        return match.group(1) if match else url.strip()
+
+    @classmethod
+    def _get_cached_url(cls, key: str) -> Optional[str]:
+        """Get a cached audio URL that has not expired, or None."""
+        with cls._url_cache_lock:
+            cached = cls._url_cache.get(key)
+            if cached and time.monotonic() - cached[1] < cls.URL_CACHE_TTL:
+                cls._url_cache.move_to_end(key)
+                return cached[0]
+        return None
 
     def run(self):
+        if self.cancelled:
+            return
+        key = self._cache_key(self.url)
+        audio_url = self._get_cached_url(key)
+        if audio_url:
+            if not self.cancelled:
+                self.signals.finished.emit(self.url, audio_url)
+            return
+
         try:
-            # Use yt-dlp to get the audio stream URL
-            result = subprocess.run(
-                [sys.executable, "-m", "yt_dlp",
-                 "--get-url",
-                 "-f", "bestaudio",
-                 "--no-warnings",
-                 self.url],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                self.finished.emit(self.url, result.stdout.strip())
-            else:
-                self.error.emit(self.url, result.stderr.strip() or "Failed to get audio URL")
+            # Use yt-dlp in-process to get the audio stream URL
+            with _youtube_dl_lock:
+                # A prefetch of the same video may have finished while waiting
+                audio_url = self._get_cached_url(key)
+                if not audio_url:
+                    info = _get_youtube_dl().extract_info(self.url, download=False)
+                    audio_url = _select_audio_url(info or {})
+                    if audio_url:
+                        with self._url_cache_lock:
+                            self._url_cache[key] = (audio_url, time.monotonic())
+                            self._url_cache.move_to_end(key)
+                            while len(self._url_cache) > self.URL_CACHE_SIZE:
+                                self._url_cache.popitem(last=False)
+            if audio_url:
+                if not self.cancelled:
+                    self.signals.finished.emit(self.url, audio_url)
+            elif not self.cancelled:
+                self.signals.error.emit(self.url, "Failed to get audio URL")
         except Exception as e:
-            self.error.emit(self.url, str(e))
+            if not self.cancelled:
+                self.signals.error.emit(self.url, str(e))
+
+
+# Item data roles for YouTube list items
+URL_ROLE = Qt.ItemDataRole.UserRole + 1  # str: video URL
+PLAY_STATE_ROLE = Qt.ItemDataRole.UserRole + 2  # int: one of the PLAY_STATE_* values
+
+PLAY_STATE_IDLE = 0
+PLAY_STATE_LOADING = 1
+PLAY_STATE_PLAYING = 2
+
+
+class YouTubeItemDelegate(QStyledItemDelegate):
+    """Delegate that paints a play/stop button in front of a YouTube list item."""
+
+    BUTTON_SIZE = 28
+    MARGIN = 2
+
+    # Button text and tooltip per play state
+    _BUTTON_STATES = {
+        PLAY_STATE_IDLE: ("▶", "Play preview"),
+        PLAY_STATE_LOADING: ("...", "Loading..."),
+        PLAY_STATE_PLAYING: ("⏹", "Stop"),
+    }
+
+    @classmethod
+    def button_rect(cls, item_rect: QRect) -> QRect:
+        """Get the play button rectangle within an item rectangle."""
+        top = item_rect.top() + (item_rect.height() - cls.BUTTON_SIZE) // 2
+        return QRect(item_rect.left() + cls.MARGIN, top, cls.BUTTON_SIZE, cls.BUTTON_SIZE)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        """Paint the button, then the item text to the right of it."""
+        style = option.widget.style() if option.widget else QApplication.style()
+        state = index.data(PLAY_STATE_ROLE) or PLAY_STATE_IDLE
+
+        # Item background (including selection) across the full width
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.text = ""
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, background, painter, option.widget)
+
+        button = QStyleOptionButton()
+        button.rect = self.button_rect(option.rect)
+        button.text = self._BUTTON_STATES[state][0]
+        button.state = QStyle.StateFlag.State_Raised
+        if state != PLAY_STATE_LOADING:
+            button.state |= QStyle.StateFlag.State_Enabled
+        style.drawControl(QStyle.ControlElement.CE_PushButton, button, painter, option.widget)
+
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect = option.rect.adjusted(self.BUTTON_SIZE + 3 * self.MARGIN, 0, 0, 0)
+        super().paint(painter, text_option, index)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Make room for the button."""
+        size = super().sizeHint(option, index)
+        return QSize(
+            size.width() + self.BUTTON_SIZE + 3 * self.MARGIN,
+            max(size.height(), self.BUTTON_SIZE + 2 * self.MARGIN)
+        )
+
+    def helpEvent(self, event, view, option, index) -> bool:
+        """Show the button tooltip when hovering the button."""
+        if event.type() == QEvent.Type.ToolTip and self.button_rect(option.rect).contains(event.pos()):
+            state = index.data(PLAY_STATE_ROLE) or PLAY_STATE_IDLE
+            QToolTip.showText(event.globalPos(), self._BUTTON_STATES[state][1], view)
+            return True
+        return super().helpEvent(event, view, option, index)
 
 
-class YouTubeItemWidget(QWidget):
-    """Custom widget for YouTube list items with play/stop button."""
+class YouTubeListWidget(QListWidget):
+    """List of YouTube items with a play/stop button painted by YouTubeItemDelegate."""
 
     play_requested = pyqtSignal(str)  # url
     stop_requested = pyqtSignal()
 
-    def __init__(self, url: str, display_text: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.url = url
-        self._is_playing = False
-        self._is_loading = False
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(2, 2, 2, 2)
-
-        # Play/Stop button
-        self.play_btn = QPushButton("▶")
-        self.play_btn.setFixedSize(28, 28)
-        self.play_btn.setToolTip("Play preview")
-        self.play_btn.clicked.connect(self._on_play_clicked)
-        layout.addWidget(self.play_btn)
-
-        # Text label
-        self.label = QLabel(display_text)
-        self.label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        layout.addWidget(self.label)
-
-    def _on_play_clicked(self):
-        if self._is_playing:
-            self.stop_requested.emit()
-        else:
-            self.play_requested.emit(self.url)
-
-    def set_playing(self, playing: bool):
-        """Update the button state."""
-        self._is_playing = playing
-        self._is_loading = False
-        if playing:
-            self.play_btn.setText("⏹")
-            self.play_btn.setToolTip("Stop")
-        else:
-            self.play_btn.setText("▶")
-            self.play_btn.setToolTip("Play preview")
-
-    def set_loading(self, loading: bool):
-        """Show loading state."""
-        self._is_loading = loading
-        if loading:
-            self.play_btn.setText("...")
-            self.play_btn.setToolTip("Loading...")
-            self.play_btn.setEnabled(False)
-        else:
-            self.play_btn.setEnabled(True)
-            if not self._is_playing:
-                self.play_btn.setText("▶")
-                self.play_btn.setToolTip("Play preview")
+        self.setItemDelegate(YouTubeItemDelegate(self))
+        # Items in one list all have the same layout (button + fixed line count)
+        self.setUniformItemSizes(True)
+
+    def mousePressEvent(self, event):
+        """Handle clicks on the play/stop button without changing the selection."""
+        index = self.indexAt(event.position().toPoint())
+        if index.isValid() and YouTubeItemDelegate.button_rect(self.visualRect(index)).contains(
+            event.position().toPoint()
+        ):
+            state = index.data(PLAY_STATE_ROLE) or PLAY_STATE_IDLE
+            if state == PLAY_STATE_PLAYING:
+                self.stop_requested.emit()
+            elif state == PLAY_STATE_IDLE:
+                self.play_requested.emit(index.data(URL_ROLE))
+            return
+        super().mousePressEvent(event)
 
 
-class SectionEditorDialog(QDialog):
+class SectionEditorDialog(YtDlpInstallMixin, QDialog):
     """Unified editor dialog for sections with tabs for fields and YouTube."""
 
     TAB_FIELDS = 0
@@ -188,6 +462,7 @@ class SectionEditorDialog(QDialog):
         super().__init__(parent)
         self.section = section
         self.slide = slide
+        self._is_song = section.is_song  # Section type does not change while editing
         self.pptx_service = pptx_service
         self.youtube_service = youtube_service
         self.initial_tab = initial_tab
@@ -195,18 +470,22 @@ class SectionEditorDialog(QDialog):
         # Fields data
         self._fields: Dict[str, str] = {}
         self._available_fields: List[SlideField] = []
+        self._field_extract_runnable: Optional[FieldExtractRunnable] = None
 
         # YouTube data
         self._youtube_urls: List[str] = list(section.youtube_links) if section.youtube_links else []
-        self._worker: Optional[SearchWorker] = None
+        self._youtube_urls_set = set(self._youtube_urls)  # For fast membership checks
+        self._worker: Optional[SearchRunnable] = None
+        self._search_request_id: int = 0
         self._results: List[YouTubeResult] = []
 
         # Audio playback
         self._audio_player: Optional[QMediaPlayer] = None
         self._audio_output: Optional[QAudioOutput] = None
-        self._audio_worker: Optional[AudioUrlWorker] = None
+        self._audio_worker: Optional[AudioUrlRunnable] = None
+        self._install_worker: Optional[PipInstallRunnable] = None
+        self._audio_prefetch_workers: List[AudioUrlRunnable] = []
         self._currently_playing_url: Optional[str] = None
-        self._item_widgets: Dict[str, YouTubeItemWidget] = {}  # url -> widget
 
         self._setup_ui()
         self._setup_audio_player()
@@ -227,6 +506,10 @@ class SectionEditorDialog(QDialog):
             # Connect player signals
             self._audio_player.mediaStatusChanged.connect(self._on_media_status_changed)
             self._audio_player.errorOccurred.connect(self._on_player_error)
+
+            # Prepare yt-dlp in background so the first preview starts faster
+            if self._is_song:
+                _get_youtube_thread_pool().start(_warm_up_youtube_dl)
         except Exception as e:
             print(f"Warning: Could not initialize audio player: {e}")
             self._audio_player = None
@@ -250,10 +533,10 @@ class SectionEditorDialog(QDialog):
         self._setup_fields_tab()
         self.tab_widget.addTab(self.fields_tab, tr("dialog.editor.tab_fields"))
 
-        # YouTube tab (only for songs)
-        if self.section.is_song:
+        # YouTube tab (only for songs); its contents are built when first shown
+        self._youtube_built = False
+        if self._is_song:
             self.youtube_tab = QWidget()
-            self._setup_youtube_tab()
             self.tab_widget.addTab(self.youtube_tab, tr("dialog.editor.tab_youtube"))
 
         # Button box
@@ -288,12 +571,9 @@ class SectionEditorDialog(QDialog):
             self.slide_title_edit = None
 
         # Fields table (stretches)
-        self.fields_table = QTableWidget()
-        self.fields_table.setColumnCount(2)
-        self.fields_table.setHorizontalHeaderLabels([
-            tr("dialog.fields.field_name"),
-            tr("dialog.fields.value")
-        ])
+        self.fields_model = FieldsModel(self)
+        self.fields_table = QTableView()
+        self.fields_table.setModel(self.fields_model)
         self.fields_table.horizontalHeader().setStretchLastSection(True)
         self.fields_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         # Enable multiline editing for value column
@@ -331,7 +611,7 @@ class SectionEditorDialog(QDialog):
         layout.addWidget(current_group_label, 0)
 
         # Current links list (stretches)
-        self.current_links_list = QListWidget()
+        self.current_links_list = YouTubeListWidget()
         self.current_links_list.setMinimumHeight(80)
         layout.addWidget(self.current_links_list, 1)
 
@@ -355,6 +635,11 @@ class SectionEditorDialog(QDialog):
         search_layout.addWidget(self.search_button)
         layout.addLayout(search_layout, 0)
 
+        # Debounce repeated Enter presses / clicks into a single search
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
         # Progress (no stretch)
         self.progress_label = QLabel(tr("dialog.youtube.searching"))
         self.progress_label.setVisible(False)
@@ -370,7 +655,7 @@ class SectionEditorDialog(QDialog):
         layout.addWidget(self.results_label, 0)
 
         # Results list (stretches)
-        self.results_list = QListWidget()
+        self.results_list = YouTubeListWidget()
         self.results_list.setAlternatingRowColors(True)
         self.results_list.setSelectionMode(QListWidget.SelectionMode.MultiSelection)
         layout.addWidget(self.results_list, 1)
@@ -411,131 +696,161 @@ class SectionEditorDialog(QDialog):
         # Fields tab
         self.add_field_btn.clicked.connect(self._on_add_field)
 
-        # YouTube tab (only if it's a song)
-        if self.section.is_song:
-            self.search_button.clicked.connect(self._do_search)
-            self.search_input.returnPressed.connect(self._do_search)
-            self.results_list.itemSelectionChanged.connect(self._on_results_selection_changed)
-            self.results_list.itemDoubleClicked.connect(self._on_result_double_click)
-            self.current_links_list.itemSelectionChanged.connect(self._on_current_links_selection_changed)
-            self.remove_link_btn.clicked.connect(self._on_remove_link)
-            self.add_selected_btn.clicked.connect(self._on_add_selected)
+    def _connect_youtube_signals(self) -> None:
+        """Connect YouTube tab widget signals."""
+        self.search_button.clicked.connect(self._search_timer.start)
+        self.search_input.returnPressed.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._do_search)
+        self.results_list.itemSelectionChanged.connect(self._on_results_selection_changed)
+        self.results_list.itemDoubleClicked.connect(self._on_result_double_click)
+        self.current_links_list.itemSelectionChanged.connect(self._on_current_links_selection_changed)
+        for list_widget in (self.current_links_list, self.results_list):
+            list_widget.play_requested.connect(self._on_play_requested)
+            list_widget.stop_requested.connect(self._stop_playback)
+        self.remove_link_btn.clicked.connect(self._on_remove_link)
+        self.add_selected_btn.clicked.connect(self._on_add_selected)
 
     def _on_tab_changed(self, index: int):
-        """Handle tab change - stop any playing audio."""
+        """Handle tab change - stop any playing audio, build the YouTube tab on first show."""
         self._stop_playback()
+        if index == self.TAB_YOUTUBE and self._is_song and not self._youtube_built:
+            self._youtube_built = True
+            self._setup_youtube_tab()
+            self._connect_youtube_signals()
+            self._load_youtube_links()
 
     def _load_data(self) -> None:
-        """Load data for all tabs."""
+        """Load data for the fields tab (the YouTube tab loads when first shown)."""
         self._load_fields()
-        if self.section.is_song:
-            self._load_youtube_links()
 
     def _load_fields(self) -> None:
-        """Load fields from the slide source."""
+        """Load fields from the slide, and the available fields from its source."""
         if self.slide:
             self._fields = dict(self.slide.fields)
+        self._populate_fields_table()
+
+        source_path = self.slide.source_path if self.slide else None
+        if not source_path:
+            self._on_fields_extracted([])
+            return
 
-            # Extract available fields from the source PPTX
-            if self.slide.source_path and os.path.exists(self.slide.source_path):
-                self._available_fields = self.pptx_service.extract_fields(
-                    self.slide.source_path,
-                    self.slide.slide_index
-                )
+        cached = _get_cached_fields(source_path, self.slide.slide_index)
+        if cached is not None:
+            self._on_fields_extracted(cached)
+            return
 
-            # Auto-add text pattern fields
-            for field in self._available_fields:
-                if field.field_type == "text_pattern" and field.name not in self._fields:
-                    self._fields[field.name] = ""
+        # Extract available fields from the source PPTX in background
+        self.add_field_combo.setEnabled(False)
+        self.add_field_btn.setEnabled(False)
+        self.no_fields_label.setText(tr("dialog.fields.loading"))
+        self.no_fields_label.setVisible(True)
+
+        runnable = FieldExtractRunnable(self.pptx_service, source_path, self.slide.slide_index)
+        runnable.signals.finished.connect(self._on_field_extract_finished)
+        self._field_extract_runnable = runnable
+        QThreadPool.globalInstance().start(runnable)
+
+    def _on_field_extract_finished(self, available_fields: List[SlideField]) -> None:
+        """Handle the background field extraction, unless it is no longer waited for."""
+        runnable = self._field_extract_runnable
+        if runnable is None or self.sender() is not runnable.signals:
+            return  # Dialog was saved or closed before the extraction finished
+        self._on_fields_extracted(available_fields)
+
+    def _on_fields_extracted(self, available_fields: List[SlideField]) -> None:
+        """Add the available fields of the source slide to the table and combo box."""
+        self._field_extract_runnable = None
+        self._available_fields = available_fields
+
+        # Auto-add text pattern fields (appended, so values typed meanwhile are kept)
+        for field in available_fields:
+            if field.field_type == "text_pattern" and field.name not in self._fields:
+                self._fields[field.name] = ""
+                self.fields_model.add_field(field.name)
 
         # Populate combo box
         self.add_field_combo.clear()
         added_names = set(self._fields.keys())
-        for field in self._available_fields:
+        for field in available_fields:
             if field.field_type == "placeholder" and field.name not in added_names:
                 self.add_field_combo.addItem(field.name, field)
         self.add_field_combo.addItem(tr("dialog.fields.custom"), None)
-
-        # Populate table
-        self._populate_fields_table()
+        self.add_field_combo.setEnabled(True)
+        self.add_field_btn.setEnabled(True)
 
         # Show no fields message if empty
-        if not self._fields and not self._available_fields:
-            self.no_fields_label.setVisible(True)
-            self.fields_table.setVisible(False)
+        no_fields = not self._fields and not available_fields
+        self.no_fields_label.setText(tr("dialog.editor.no_fields"))
+        self.no_fields_label.setVisible(no_fields)
+        self.fields_table.setVisible(not no_fields)
 
     def _populate_fields_table(self) -> None:
-        """Populate the fields table."""
-        self.fields_table.setRowCount(len(self._fields))
-
-        for row, (name, value) in enumerate(self._fields.items()):
-            name_item = QTableWidgetItem(name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.fields_table.setItem(row, 0, name_item)
-
-            value_item = QTableWidgetItem(value)
-            self.fields_table.setItem(row, 1, value_item)
+        """Populate the fields table (a single model reset, so rows are sized once)."""
+        self.fields_model.set_fields(self._fields)
 
     def _load_youtube_links(self) -> None:
         """Load current YouTube links with play buttons."""
         self.current_links_list.clear()
-        self._item_widgets.clear()
 
         for url in self._youtube_urls:
             self._add_link_item(self.current_links_list, url, url)
 
     def _add_link_item(self, list_widget: QListWidget, url: str, display_text: str):
         """Add a link item with play button to the list."""
-        item = QListWidgetItem()
-        widget = YouTubeItemWidget(url, display_text)
-        widget.play_requested.connect(self._on_play_requested)
-        widget.stop_requested.connect(self._stop_playback)
-
-        item.setSizeHint(widget.sizeHint())
+        item = QListWidgetItem(display_text)
+        item.setData(URL_ROLE, url)
         list_widget.addItem(item)
-        list_widget.setItemWidget(item, widget)
-
-        self._item_widgets[url] = widget
 
     def _add_result_item(self, result: YouTubeResult):
         """Add a search result item with play button."""
-        item = QListWidgetItem()
-        display_text = f"{result.title}\n  {result.channel} - {result.duration}"
-        widget = YouTubeItemWidget(result.url, display_text)
-        widget.play_requested.connect(self._on_play_requested)
-        widget.stop_requested.connect(self._stop_playback)
-
+        item = QListWidgetItem(f"{result.title}\n  {result.channel} - {result.duration}")
         item.setData(Qt.ItemDataRole.UserRole, result)
-        item.setSizeHint(widget.sizeHint())
+        item.setData(URL_ROLE, result.url)
         self.results_list.addItem(item)
-        self.results_list.setItemWidget(item, widget)
 
-        self._item_widgets[result.url] = widget
+    def _set_play_state(self, url: Optional[str], state: int) -> None:
+        """Update the play button of all list items for a URL."""
+        if not url or not self._youtube_built:
+            return
+        for list_widget in (self.current_links_list, self.results_list):
+            for row in range(list_widget.count()):
+                item = list_widget.item(row)
+                if item.data(URL_ROLE) == url:
+                    item.setData(PLAY_STATE_ROLE, state)
 
     def _on_play_requested(self, url: str):
         """Handle play request for a URL."""
         if not self._audio_player:
             return  # Audio not available
 
-        # Stop any current playback
+        # Stop any current playback, and prefetches that would hold up this one
         self._stop_playback()
+        self._cancel_audio_prefetch()
+
+        # A cancelled worker emits nothing, so reset its loading state here
+        if self._audio_worker:
+            self._audio_worker.cancelled = True
+            self._set_play_state(self._audio_worker.url, PLAY_STATE_IDLE)
 
         # Set loading state for the requested URL
-        if url in self._item_widgets:
-            self._item_widgets[url].set_loading(True)
+        self._set_play_state(url, PLAY_STATE_LOADING)
 
         # Start worker to get audio URL
-        self._audio_worker = AudioUrlWorker(url)
-        self._audio_worker.finished.connect(self._on_audio_url_ready)
-        self._audio_worker.error.connect(self._on_audio_url_error)
-        self._audio_worker.start()
+        self._audio_worker = AudioUrlRunnable(url)
+        self._audio_worker.signals.finished.connect(self._on_audio_url_ready)
+        self._audio_worker.signals.error.connect(self._on_audio_url_error)
+        _get_youtube_thread_pool().start(self._audio_worker)
+
+    def _is_current_audio_worker(self) -> bool:
+        """Check whether the emitting signals belong to the pending audio worker."""
+        return self._audio_worker is not None and self.sender() is self._audio_worker.signals
 
     def _on_audio_url_ready(self, url: str, audio_url: str):
         """Handle when audio URL is extracted."""
-        if url in self._item_widgets:
-            self._item_widgets[url].set_loading(False)
-
+        if not self._is_current_audio_worker():
+            return  # Emitted just before a newer preview cancelled it
         if not self._audio_player:
+            self._set_play_state(url, PLAY_STATE_IDLE)
             return
 
         # Play the audio
@@ -544,13 +859,13 @@ class SectionEditorDialog(QDialog):
         self._audio_player.play()
 
         # Update button state
-        if url in self._item_widgets:
-            self._item_widgets[url].set_playing(True)
+        self._set_play_state(url, PLAY_STATE_PLAYING)
 
     def _on_audio_url_error(self, url: str, error: str):
         """Handle audio URL extraction error."""
-        if url in self._item_widgets:
-            self._item_widgets[url].set_loading(False)
+        if not self._is_current_audio_worker():
+            return
+        self._set_play_state(url, PLAY_STATE_IDLE)
         # Silently fail - user can try again
 
     def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus):
@@ -566,12 +881,12 @@ class SectionEditorDialog(QDialog):
     def _stop_playback(self):
         """Stop any current playback."""
         if self._audio_player:
-            # Clear the source first to avoid blocking on network streams
-            self._audio_player.setSource(QUrl())
+            # Stop without clearing the source, so the audio pipeline is kept;
+            # the next preview replaces the source
+            self._audio_player.stop()
 
         # Reset button state for currently playing URL
-        if self._currently_playing_url and self._currently_playing_url in self._item_widgets:
-            self._item_widgets[self._currently_playing_url].set_playing(False)
+        self._set_play_state(self._currently_playing_url, PLAY_STATE_IDLE)
 
         self._currently_playing_url = None
 
@@ -586,9 +901,9 @@ class SectionEditorDialog(QDialog):
                 tr("dialog.fields.custom_title"),
                 tr("dialog.fields.custom_name")
             )
-            if not ok or not name.strip():
+            field_name = _FIELD_SANITIZER.sub("_", name.strip().upper()).strip("_")
+            if not ok or not field_name:
                 return
-            field_name = name.strip().upper().replace(" ", "_")
         else:
             field_name = field.name
 
@@ -601,16 +916,7 @@ class SectionEditorDialog(QDialog):
             return
 
         self._fields[field_name] = ""
-
-        row = self.fields_table.rowCount()
-        self.fields_table.setRowCount(row + 1)
-
-        name_item = QTableWidgetItem(field_name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.fields_table.setItem(row, 0, name_item)
-
-        value_item = QTableWidgetItem("")
-        self.fields_table.setItem(row, 1, value_item)
+        self.fields_model.add_field(field_name)
 
         idx = self.add_field_combo.findText(field_name)
         if idx >= 0:
@@ -625,30 +931,35 @@ class SectionEditorDialog(QDialog):
         if not self.youtube_service.is_yt_dlp_available():
             return
 
-        # Stop any playback before clearing results
+        # Stop any playback and prefetching before clearing results
         self._stop_playback()
+        self._cancel_audio_prefetch()
 
         self.progress_label.setVisible(True)
         self.progress_bar.setVisible(True)
         self.no_results_label.setVisible(False)
         self.results_list.clear()
-        # Clear widget references for old results
-        self._item_widgets = {k: v for k, v in self._item_widgets.items() if k in self._youtube_urls}
         self.search_button.setEnabled(False)
 
-        self._worker = SearchWorker(self.youtube_service, query)
-        self._worker.finished.connect(self._on_search_finished)
-        self._worker.error.connect(self._on_search_error)
-        self._worker.start()
+        if self._worker:
+            self._worker.cancelled = True
+        self._search_request_id += 1
+        self._worker = SearchRunnable(self.youtube_service, query, self._search_request_id)
+        self._worker.signals.finished.connect(self._on_search_finished)
+        self._worker.signals.error.connect(self._on_search_error)
+        _get_youtube_thread_pool().start(self._worker)
 
-    def _on_search_finished(self, results: List[YouTubeResult]) -> None:
+    def _on_search_finished(self, results: List[YouTubeResult], request_id: int) -> None:
         """Handle search completion."""
+        if request_id != self._search_request_id:
+            return  # Stale result from a superseded search
         self.progress_label.setVisible(False)
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
 
+        # The list was cleared when this search started, and results of
+        # superseded searches are dropped above
         self._results = results
-        self.results_list.clear()
 
         if not results:
             self.no_results_label.setVisible(True)
@@ -657,8 +968,29 @@ class SectionEditorDialog(QDialog):
         for result in results:
             self._add_result_item(result)
 
-    def _on_search_error(self, error: str) -> None:
+        self._prefetch_audio_urls(results[:AUDIO_PREFETCH_COUNT])
+
+    def _prefetch_audio_urls(self, results: List[YouTubeResult]) -> None:
+        """Resolve audio URLs of results in background, so previewing them starts faster."""
+        self._cancel_audio_prefetch()
+        if not self._audio_player:
+            return
+        for result in results:
+            # Results land in AudioUrlRunnable's URL cache; nothing is shown
+            runnable = AudioUrlRunnable(result.url)
+            self._audio_prefetch_workers.append(runnable)
+            _get_audio_prefetch_thread_pool().start(runnable)
+
+    def _cancel_audio_prefetch(self) -> None:
+        """Cancel audio URL prefetches that have not started yet."""
+        for runnable in self._audio_prefetch_workers:
+            runnable.cancelled = True
+        self._audio_prefetch_workers.clear()
+
+    def _on_search_error(self, error: str, request_id: int) -> None:
         """Handle search error."""
+        if request_id != self._search_request_id:
+            return
         self.progress_label.setVisible(False)
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
@@ -674,8 +1006,9 @@ class SectionEditorDialog(QDialog):
     def _on_result_double_click(self, item: QListWidgetItem) -> None:
         """Handle double-click on search result - add it to links."""
         result = item.data(Qt.ItemDataRole.UserRole)
-        if result and result.url not in self._youtube_urls:
+        if result and result.url not in self._youtube_urls_set:
             self._youtube_urls.append(result.url)
+            self._youtube_urls_set.add(result.url)
             self._add_link_item(self.current_links_list, result.url, result.url)
 
     def _on_current_links_selection_changed(self) -> None:
@@ -688,13 +1021,11 @@ class SectionEditorDialog(QDialog):
         selected = self.current_links_list.selectedItems()
         for item in selected:
             row = self.current_links_list.row(item)
-            widget = self.current_links_list.itemWidget(item)
-            if widget and hasattr(widget, 'url'):
-                url = widget.url
-                if url in self._youtube_urls:
+            url = item.data(URL_ROLE)
+            if url:
+                if url in self._youtube_urls_set:
                     self._youtube_urls.remove(url)
-                if url in self._item_widgets:
-                    del self._item_widgets[url]
+                    self._youtube_urls_set.discard(url)
                 # Stop if this was playing
                 if url == self._currently_playing_url:
                     self._stop_playback()
@@ -705,14 +1036,16 @@ class SectionEditorDialog(QDialog):
         selected = self.results_list.selectedItems()
         for item in selected:
             result = item.data(Qt.ItemDataRole.UserRole)
-            if result and result.url not in self._youtube_urls:
+            if result and result.url not in self._youtube_urls_set:
                 self._youtube_urls.append(result.url)
+                self._youtube_urls_set.add(result.url)
                 self._add_link_item(self.current_links_list, result.url, result.url)
 
     def _on_save(self) -> None:
         """Save all changes and close."""
-        # Stop any playback
+        # Stop any playback, and drop a field extraction that is still running
         self._stop_playback()
+        self._field_extract_runnable = None
 
         # Save section name
         new_section_name = self.section_name_edit.text().strip()
@@ -727,16 +1060,12 @@ class SectionEditorDialog(QDialog):
 
         # Save fields
         if self.slide:
-            self._fields.clear()
-            for row in range(self.fields_table.rowCount()):
-                name = self.fields_table.item(row, 0).text()
-                value = self.fields_table.item(row, 1).text()
-                if value:
-                    self._fields[name] = value
-            self.slide.fields = self._fields
+            self._fields = {name: value for name, value in self.fields_model.get_fields() if value}
+            # A copy, so later changes to the dialog's fields cannot reach the slide
+            self.slide.fields = dict(self._fields)
 
         # Save YouTube links
-        if self.section.is_song:
+        if self._is_song:
             self.section.youtube_links = self._youtube_urls
 
         self.accept()
@@ -744,6 +1073,7 @@ class SectionEditorDialog(QDialog):
     def reject(self):
         """Handle dialog rejection - stop playback."""
         self._stop_playback()
+        self._field_extract_runnable = None
         super().reject()
 
     def closeEvent(self, event):
@@ -766,60 +1096,6 @@ class SectionEditorDialog(QDialog):
         layout = self.youtube_tab.layout()
         layout.addWidget(self.install_button)
 
-    def _install_ytdlp(self) -> None:
-        """Install yt-dlp package."""
-        self.install_button.setEnabled(False)
-        self.install_button.setText("Installing...")
-        self.warning_label.setText("Installing yt-dlp, please wait...")
-
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
-
-        try:
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "yt-dlp"],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-
-            if result.returncode == 0:
-                self.youtube_service._yt_dlp_available = None
-
-                if self.youtube_service.is_yt_dlp_available():
-                    self.warning_label.setText("yt-dlp installed successfully!")
-                    self.install_button.setVisible(False)
-                    self.search_button.setEnabled(True)
-                    self.results_label.setVisible(True)
-                    self.results_list.setVisible(True)
-
-                    QMessageBox.information(
-                        self,
-                        "Installation Complete",
-                        "yt-dlp has been installed. You can now search for YouTube videos."
-                    )
-                else:
-                    self.warning_label.setText(
-                        "Installation completed but yt-dlp is still not available. "
-                        "Please restart the application."
-                    )
-                    self.install_button.setText("Installed - Restart app")
-            else:
-                self.warning_label.setText(
-                    f"Installation failed: {result.stderr[:200] if result.stderr else 'Unknown error'}"
-                )
-                self.install_button.setEnabled(True)
-                self.install_button.setText("Retry installation")
-
-        except subprocess.TimeoutExpired:
-            self.warning_label.setText("Installation timed out. Please try again or install manually.")
-            self.install_button.setEnabled(True)
-            self.install_button.setText("Retry installation")
-        except Exception as e:
-            self.warning_label.setText(f"Installation error: {str(e)}")
-            self.install_button.setEnabled(True)
-            self.install_button.setText("Retry installation")
-
     def get_fields(self) -> Dict[str, str]:
         """Get the edited fields."""
         return self._fields
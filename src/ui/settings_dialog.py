@@ -1,7 +1,9 @@
 """Settings dialog for configuring application settings."""
 
 import os
-from typing import Optional
+from dataclasses import replace
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog,
@@ -18,7 +20,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QSpinBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QDir
 
 from ..models import Settings
 from ..i18n import tr
@@ -29,32 +31,23 @@ class SettingsDialog(QDialog):
 
     def __init__(self, settings: Settings, base_path: str, parent=None):
         super().__init__(parent)
-        self.settings = Settings(
-            base_folder=settings.base_folder,
-            songs_folder=settings.songs_folder,
-            algemeen_folder=settings.algemeen_folder,
-            output_folder=settings.output_folder,
-            themes_folder=settings.themes_folder,
-            collecte_filename=settings.collecte_filename,
-            stub_template_filename=settings.stub_template_filename,
-            output_pattern=settings.output_pattern,
-            language=settings.language,
-            song_cover_enabled=settings.song_cover_enabled,
-            song_cover_filename=settings.song_cover_filename,
-            excel_register_path=settings.excel_register_path,
-            pptx_archive_folder=settings.pptx_archive_folder,
-            bible_font_name=settings.bible_font_name,
-            bible_font_size=settings.bible_font_size,
-            bible_show_verse_numbers=settings.bible_show_verse_numbers,
-            youversion_api_key=settings.youversion_api_key,
-            window_width=settings.window_width,
-            window_height=settings.window_height,
+        self.settings = replace(
+            settings, user_liturgy_items=list(settings.user_liturgy_items)
         )
         self.base_path = base_path
-
-        self._setup_ui()
-        self._load_settings()
-        self._connect_signals()
+        # isdir() results for browse start folders; these can be slow on network drives
+        self._path_stat_cache: Dict[str, bool] = {}
+        self._norm_base: Optional[str] = None
+        self._ui_built = False
+
+    def showEvent(self, event) -> None:
+        """Build the form the first time the dialog is shown."""
+        if not self._ui_built:
+            self._ui_built = True
+            self._setup_ui()
+            self._load_settings()
+            self._connect_signals()
+        super().showEvent(event)
 
     def _setup_ui(self) -> None:
         """Setup the dialog UI."""
@@ -64,16 +57,16 @@ class SettingsDialog(QDialog):
 
         layout = QVBoxLayout(self)
 
+        browse_text = tr("button.browse")
+        browse_file_text = tr("button.browse_file")
+
         # Base folder group
         base_group = QGroupBox(tr("dialog.settings.base_folder_group"))
         base_layout = QFormLayout(base_group)
 
-        self.base_folder_input = QLineEdit()
-        base_browse = QPushButton(tr("button.browse"))
-        base_browse.clicked.connect(self._browse_base_folder)
-        base_folder_layout = QHBoxLayout()
-        base_folder_layout.addWidget(self.base_folder_input)
-        base_folder_layout.addWidget(base_browse)
+        self.base_folder_input, _, base_folder_layout = self._make_browse_row(
+            browse_text, self._browse_base_folder
+        )
         base_layout.addRow(tr("dialog.settings.base_folder"), base_folder_layout)
 
         layout.addWidget(base_group)
@@ -83,48 +76,23 @@ class SettingsDialog(QDialog):
         folders_layout = QFormLayout(folders_group)
 
         # Songs folder
-        self.songs_folder_input = QLineEdit()
-        songs_browse = QPushButton(tr("button.browse"))
-        songs_browse.clicked.connect(lambda: self._browse_folder(self.songs_folder_input))
-        songs_layout = QHBoxLayout()
-        songs_layout.addWidget(self.songs_folder_input)
-        songs_layout.addWidget(songs_browse)
+        self.songs_folder_input, _, songs_layout = self._make_browse_row(browse_text)
         folders_layout.addRow(tr("dialog.settings.songs_folder"), songs_layout)
 
         # Algemeen folder
-        self.algemeen_folder_input = QLineEdit()
-        algemeen_browse = QPushButton(tr("button.browse"))
-        algemeen_browse.clicked.connect(lambda: self._browse_folder(self.algemeen_folder_input))
-        algemeen_layout = QHBoxLayout()
-        algemeen_layout.addWidget(self.algemeen_folder_input)
-        algemeen_layout.addWidget(algemeen_browse)
+        self.algemeen_folder_input, _, algemeen_layout = self._make_browse_row(browse_text)
         folders_layout.addRow(tr("dialog.settings.algemeen_folder"), algemeen_layout)
 
         # Themes folder
-        self.themes_folder_input = QLineEdit()
-        themes_browse = QPushButton(tr("button.browse"))
-        themes_browse.clicked.connect(lambda: self._browse_folder(self.themes_folder_input))
-        themes_layout = QHBoxLayout()
-        themes_layout.addWidget(self.themes_folder_input)
-        themes_layout.addWidget(themes_browse)
+        self.themes_folder_input, _, themes_layout = self._make_browse_row(browse_text)
         folders_layout.addRow(tr("dialog.settings.themes_folder"), themes_layout)
 
         # Output folder
-        self.output_folder_input = QLineEdit()
-        output_browse = QPushButton(tr("button.browse"))
-        output_browse.clicked.connect(lambda: self._browse_folder(self.output_folder_input))
-        output_layout = QHBoxLayout()
-        output_layout.addWidget(self.output_folder_input)
-        output_layout.addWidget(output_browse)
+        self.output_folder_input, _, output_layout = self._make_browse_row(browse_text)
         folders_layout.addRow(tr("dialog.settings.output_folder"), output_layout)
 
         # PPTX archive folder
-        self.pptx_archive_input = QLineEdit()
-        pptx_archive_browse = QPushButton(tr("button.browse"))
-        pptx_archive_browse.clicked.connect(lambda: self._browse_folder(self.pptx_archive_input))
-        pptx_archive_layout = QHBoxLayout()
-        pptx_archive_layout.addWidget(self.pptx_archive_input)
-        pptx_archive_layout.addWidget(pptx_archive_browse)
+        self.pptx_archive_input, _, pptx_archive_layout = self._make_browse_row(browse_text)
         folders_layout.addRow(tr("dialog.settings.pptx_archive_folder"), pptx_archive_layout)
 
         layout.addWidget(folders_group)
@@ -146,24 +114,18 @@ class SettingsDialog(QDialog):
         files_layout.addRow(tr("dialog.settings.output_pattern"), self.output_pattern_input)
 
         # Excel register file
-        self.excel_register_input = QLineEdit()
-        excel_browse = QPushButton(tr("button.browse_file"))
-        excel_browse.clicked.connect(self._browse_excel_file)
-        excel_layout = QHBoxLayout()
-        excel_layout.addWidget(self.excel_register_input)
-        excel_layout.addWidget(excel_browse)
+        self.excel_register_input, _, excel_layout = self._make_browse_row(
+            browse_file_text, self._browse_excel_file
+        )
         files_layout.addRow(tr("dialog.settings.excel_register"), excel_layout)
 
         # Song cover slide
         self.song_cover_checkbox = QCheckBox(tr("dialog.settings.song_cover_enabled"))
         files_layout.addRow("", self.song_cover_checkbox)
 
-        self.song_cover_input = QLineEdit()
-        song_cover_browse = QPushButton(tr("button.browse_file"))
-        song_cover_browse.clicked.connect(self._browse_song_cover_file)
-        song_cover_layout = QHBoxLayout()
-        song_cover_layout.addWidget(self.song_cover_input)
-        song_cover_layout.addWidget(song_cover_browse)
+        self.song_cover_input, song_cover_browse, song_cover_layout = self._make_browse_row(
+            browse_file_text, self._browse_song_cover_file
+        )
         files_layout.addRow(tr("dialog.settings.song_cover_file"), song_cover_layout)
 
         self.song_cover_checkbox.toggled.connect(self.song_cover_input.setEnabled)
@@ -227,31 +189,60 @@ class SettingsDialog(QDialog):
         self.button_box.button(QDialogButtonBox.StandardButton.Cancel).setText(tr("button.cancel"))
         layout.addWidget(self.button_box)
 
+    def _make_browse_row(
+        self,
+        button_text: str,
+        browse_cb: Optional[Callable[[], None]] = None,
+    ) -> Tuple[QLineEdit, QPushButton, QHBoxLayout]:
+        """Create a line edit with a browse button next to it.
+
+        Without a callback the button opens a folder browser for the line edit.
+        """
+        line_edit = QLineEdit()
+        button = QPushButton(button_text)
+        if browse_cb is None:
+            button.clicked.connect(partial(self._browse_folder, line_edit))
+        else:
+            button.clicked.connect(browse_cb)
+        row = QHBoxLayout()
+        row.addWidget(line_edit)
+        row.addWidget(button)
+        return line_edit, button, row
+
     def _load_settings(self) -> None:
         """Load current settings into the form."""
-        self.base_folder_input.setText(self.settings.base_folder)
-        self.songs_folder_input.setText(self.settings.songs_folder)
-        self.algemeen_folder_input.setText(self.settings.algemeen_folder)
-        self.themes_folder_input.setText(self.settings.themes_folder)
-        self.output_folder_input.setText(self.settings.output_folder)
-        self.collecte_input.setText(self.settings.collecte_filename)
-        self.stub_template_input.setText(self.settings.stub_template_filename)
-        self.bible_template_input.setText(self.settings.bible_template_filename)
-        self.output_pattern_input.setText(self.settings.output_pattern)
-        self.excel_register_input.setText(self.settings.excel_register_path)
-        self.pptx_archive_input.setText(self.settings.pptx_archive_folder)
+        line_edits = (
+            (self.base_folder_input, self.settings.base_folder),
+            (self.songs_folder_input, self.settings.songs_folder),
+            (self.algemeen_folder_input, self.settings.algemeen_folder),
+            (self.themes_folder_input, self.settings.themes_folder),
+            (self.output_folder_input, self.settings.output_folder),
+            (self.collecte_input, self.settings.collecte_filename),
+            (self.stub_template_input, self.settings.stub_template_filename),
+            (self.bible_template_input, self.settings.bible_template_filename),
+            (self.output_pattern_input, self.settings.output_pattern),
+            (self.excel_register_input, self.settings.excel_register_path),
+            (self.pptx_archive_input, self.settings.pptx_archive_folder),
+            (self.song_cover_input, self.settings.song_cover_filename),
+            (self.bible_font_name_input, self.settings.bible_font_name),
+            (self.youversion_api_key_input, self.settings.youversion_api_key),
+        )
+        # Nothing needs to react to the initial values
+        for line_edit, text in line_edits:
+            line_edit.blockSignals(True)
+            try:
+                line_edit.setText(text)
+            finally:
+                line_edit.blockSignals(False)
 
         # Song cover
         self.song_cover_checkbox.setChecked(self.settings.song_cover_enabled)
-        self.song_cover_input.setText(self.settings.song_cover_filename)
         self.song_cover_input.setEnabled(self.settings.song_cover_enabled)
 
         # Bible text settings
-        self.bible_font_name_input.setText(self.settings.bible_font_name)
         self.bible_font_size_spin.setValue(self.settings.bible_font_size)
         self.bible_chars_per_slide_spin.setValue(self.settings.bible_chars_per_slide)
         self.bible_show_verse_numbers_check.setChecked(self.settings.bible_show_verse_numbers)
-        self.youversion_api_key_input.setText(self.settings.youversion_api_key)
 
         # Set language combo
         index = self.language_combo.findData(self.settings.language)
@@ -262,90 +253,142 @@ class SettingsDialog(QDialog):
         """Connect widget signals."""
         self.button_box.accepted.connect(self._on_accept)
         self.button_box.rejected.connect(self.reject)
+        self.base_folder_input.textChanged.connect(self._on_base_folder_changed)
+
+    def _on_base_folder_changed(self) -> None:
+        """Forget path checks that depend on the base folder."""
+        self._path_stat_cache.clear()
+        self._norm_base = None
+
+    def _isdir(self, path: str) -> bool:
+        """Cached os.path.isdir for the lifetime of the dialog."""
+        result = self._path_stat_cache.get(path)
+        if result is None:
+            result = self._path_stat_cache[path] = os.path.isdir(path)
+        return result
+
+    def _dir_or(self, path: str, fallback: str) -> str:
+        """Return path if it is an existing folder, otherwise fallback."""
+        return path if path and self._isdir(path) else fallback
 
     def _get_effective_base(self) -> str:
         """Get the effective base folder for browsing."""
-        base = self.base_folder_input.text()
-        if base and os.path.isdir(base):
-            return base
-        return self.base_path
+        return self._dir_or(self.base_folder_input.text(), self.base_path)
+
+    @staticmethod
+    def _resolve_against_base(path: str, base: str) -> str:
+        """Resolve a setting path that may be relative to the base folder."""
+        if path and not os.path.isabs(path):
+            return os.path.join(base, path)
+        return path
+
+    def _relative_to_base(self, path: str) -> str:
+        """Make a path relative to the base folder if it lies inside it."""
+        if self._norm_base is None:
+            self._norm_base = os.path.normpath(self._get_effective_base())
+        try:
+            rel_path = os.path.relpath(path, self._norm_base)
+        except ValueError:
+            return path  # Different drives on Windows
+        if rel_path.startswith(".."):
+            return path
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        return "./" + rel_path
+
+    def _make_dialog(
+        self,
+        mode: QFileDialog.FileMode,
+        caption: str,
+        start: str,
+        name_filter: str = "",
+    ) -> QFileDialog:
+        """Create a browse dialog that does not probe every entry for icons.
+
+        The static QFileDialog helpers can freeze for seconds on network
+        folders while the native dialog looks up per-directory icons.
+        """
+        dialog = QFileDialog(self, caption, start)
+        dialog.setOptions(
+            QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.DontUseNativeDialog
+        )
+        dialog.setFileMode(mode)
+        dialog.setViewMode(QFileDialog.ViewMode.List)
+        if mode == QFileDialog.FileMode.Directory:
+            # Keep folder creation available, but never list files
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly)
+            dialog.setFilter(
+                QDir.Filter.Dirs | QDir.Filter.Drives | QDir.Filter.NoDotAndDotDot
+            )
+        else:
+            dialog.setOption(QFileDialog.Option.ReadOnly)
+        if name_filter:
+            dialog.setNameFilter(name_filter)
+        return dialog
+
+    @staticmethod
+    def _run_dialog(dialog: QFileDialog) -> str:
+        """Show a browse dialog and return the selected path, or "" if cancelled."""
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return ""
+        selected = dialog.selectedFiles()
+        return selected[0] if selected else ""
 
     def _browse_base_folder(self) -> None:
         """Open folder browser for base folder."""
-        current = self.base_folder_input.text()
-        if not current or not os.path.isdir(current):
-            current = self.base_path
+        current = self._dir_or(self.base_folder_input.text(), self.base_path)
 
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        folder = self._run_dialog(self._make_dialog(
+            QFileDialog.FileMode.Directory,
             tr("dialog.settings.base_folder"),
             current
-        )
+        ))
 
         if folder:
             self.base_folder_input.setText(folder)
 
     def _browse_folder(self, line_edit: QLineEdit) -> None:
         """Open folder browser dialog."""
-        current = line_edit.text()
         base = self._get_effective_base()
-        if current and not os.path.isabs(current):
-            current = os.path.join(base, current)
+        current = self._resolve_against_base(line_edit.text(), base)
 
-        folder = QFileDialog.getExistingDirectory(
-            self,
+        folder = self._run_dialog(self._make_dialog(
+            QFileDialog.FileMode.Directory,
             tr("button.browse"),
-            current if os.path.exists(current) else base
-        )
+            self._dir_or(current, base)
+        ))
 
         if folder:
-            # Try to make relative path to base folder
-            try:
-                rel_path = os.path.relpath(folder, base)
-                if not rel_path.startswith(".."):
-                    folder = "./" + rel_path.replace("\\", "/")
-            except ValueError:
-                pass  # Different drives on Windows
-
-            line_edit.setText(folder)
+            line_edit.setText(self._relative_to_base(folder))
 
     def _browse_excel_file(self) -> None:
         """Open file browser for Excel register file."""
-        current = self.excel_register_input.text()
         base = self._get_effective_base()
-        if current and not os.path.isabs(current):
-            current = os.path.join(base, current)
+        current = self._resolve_against_base(self.excel_register_input.text(), base)
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._run_dialog(self._make_dialog(
+            QFileDialog.FileMode.ExistingFile,
             tr("dialog.settings.excel_register"),
-            current if current and os.path.exists(os.path.dirname(current)) else base,
+            current if current and self._isdir(os.path.dirname(current)) else base,
             "Excel files (*.xlsx *.xls);;All files (*.*)"
-        )
+        ))
 
         if file_path:
-            # Try to make relative path to base folder
-            try:
-                rel_path = os.path.relpath(file_path, base)
-                if not rel_path.startswith(".."):
-                    file_path = "./" + rel_path.replace("\\", "/")
-            except ValueError:
-                pass  # Different drives on Windows
-
-            self.excel_register_input.setText(file_path)
+            self.excel_register_input.setText(self._relative_to_base(file_path))
 
     def _browse_song_cover_file(self) -> None:
         """Open file browser for song cover slide PPTX."""
         base = self._get_effective_base()
         algemeen = self.settings.get_algemeen_path(base)
-        start_dir = algemeen if os.path.isdir(algemeen) else base
+        start_dir = self._dir_or(algemeen, base)
 
-        file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        file_path = self._run_dialog(self._make_dialog(
+            QFileDialog.FileMode.ExistingFile,
             tr("dialog.settings.song_cover_file"),
             start_dir,
             "PowerPoint files (*.pptx);;All files (*.*)"
-        )
+        ))
 
         if file_path:
             # Store just the filename (file lives in algemeen folder)
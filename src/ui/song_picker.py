@@ -1,5 +1,7 @@
 """Dialog for selecting songs from the Songs folder."""
 
+import heapq
+import os
 from typing import List, Optional
 
 from PyQt6.QtWidgets import (
@@ -8,6 +10,9 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QTreeWidget,
     QTreeWidgetItem,
+    QListWidget,
+    QListWidgetItem,
+    QStackedWidget,
     QLineEdit,
     QPushButton,
     QCheckBox,
@@ -18,18 +23,69 @@ from PyQt6.QtWidgets import (
     QInputDialog,
     QFrame,
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import Qt, QObject, QRunnable, QSize, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon, QImage, QPixmap, QPixmapCache
 
 from ..models import Song, SongLiturgyItem, Settings
 from ..services import PptxService
-from ..services.song_matcher import normalize_for_search as _normalize_for_search, fuzzy_match_score as _fuzzy_match_raw
+from ..services.song_matcher import normalize_for_search as _normalize_for_search, fuzzy_match_normalized
 from ..i18n import tr
 
+# Delay (ms) that collapses fast typing into a single filter pass
+SEARCH_DEBOUNCE_MS = 120
 
-def _fuzzy_match(query: str, text: str) -> float:
-    """Calculate fuzzy match score between query and text."""
-    return _fuzzy_match_raw(query, text)
+# Maximum number of ranked search results shown
+MAX_SEARCH_RESULTS = 200
+
+# Shorter queries match nearly every song, so the folder tree is kept instead
+MIN_SEARCH_LENGTH = 2
+
+
+def _char_mask(text: str) -> int:
+    """Get a bit mask of the characters in a normalized string."""
+    mask = 0
+    for char in set(text):
+        mask |= 1 << ord(char)
+    return mask
+
+
+class SongThumbnailSignals(QObject):
+    """Signals for song thumbnail workers (one instance is shared by many runnables)."""
+    finished = pyqtSignal(str, str, QImage)  # pptx_path, cache key, scaled image (may be null)
+
+
+class SongThumbnailRunnable(QRunnable):
+    """Runnable that reads and scales the embedded thumbnail of a song's PPTX.
+
+    The image is decoded and scaled here as a QImage, so the GUI thread
+    only has to convert it to a pixmap.
+    """
+
+    def __init__(self, pptx_service: PptxService, signals: SongThumbnailSignals,
+                 pptx_path: str, cache_key: str, target_size: QSize, pixel_ratio: float = 1.0):
+        super().__init__()
+        self.pptx_service = pptx_service
+        self.signals = signals
+        self.pptx_path = pptx_path
+        self.cache_key = cache_key
+        self.target_size = target_size
+        self.pixel_ratio = pixel_ratio
+
+    def run(self):
+        """Load the thumbnail in background."""
+        image = QImage()
+        try:
+            thumb_data = self.pptx_service.get_thumbnail(self.pptx_path)
+            if thumb_data and image.loadFromData(thumb_data):
+                image = image.scaled(
+                    self.target_size * self.pixel_ratio,
+                    Qt.AspectRatioMode.KeepAspectRatio,
+                    Qt.TransformationMode.SmoothTransformation
+                )
+                image.setDevicePixelRatio(self.pixel_ratio)
+        except Exception:
+            image = QImage()
+        self.signals.finished.emit(self.pptx_path, self.cache_key, image)
 
 
 class SongPickerDialog(QDialog):
@@ -54,6 +110,9 @@ class SongPickerDialog(QDialog):
         self._external_title: Optional[str] = None
         self._new_song_created: bool = False
 
+        self._thread_pool = QThreadPool.globalInstance()
+        self._thumb_signals = SongThumbnailSignals()
+
         self._setup_ui()
         self._populate_tree()
         self._connect_signals()
@@ -76,11 +135,18 @@ class SongPickerDialog(QDialog):
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
 
-        # Song tree
+        # Song tree, swapped for a flat list of ranked matches while searching
         self.tree = QTreeWidget()
         self.tree.setHeaderHidden(True)
         self.tree.setAlternatingRowColors(True)
-        layout.addWidget(self.tree)
+
+        self.results_list = QListWidget()
+        self.results_list.setAlternatingRowColors(True)
+
+        self.view_stack = QStackedWidget()
+        self.view_stack.addWidget(self.tree)
+        self.view_stack.addWidget(self.results_list)
+        layout.addWidget(self.view_stack)
 
         # Preview area with thumbnail and info
         preview_layout = QHBoxLayout()
@@ -136,57 +202,78 @@ class SongPickerDialog(QDialog):
         # Initially disable OK button
         self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
 
+        # Filter once typing pauses instead of on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
     def _populate_tree(self) -> None:
         """Populate the tree with songs organized by folder hierarchy."""
         self.tree.clear()
         self._song_items = {}  # Map from relative_path to QTreeWidgetItem
-
-        # Build tree structure
-        folder_items = {}  # Map from folder path to QTreeWidgetItem
+        # Normalized search fields (with their character masks) per song,
+        # so filtering only normalizes the query
+        self._search_index = []
+        self.results_list.clear()
+        self._result_songs = []  # Songs currently listed in results_list
+
+        # Build the items first and attach them in one call per parent,
+        # rather than inserting them into the live tree one by one
+        folder_items = {}  # Map from folder path parts to QTreeWidgetItem
+        folder_children = {}  # Map from folder path parts to its child items
+        top_level_items = []
 
         for song in self.songs:
+            # Read the display title once for both the index and the tree item
+            display_title = song.display_title
+            fields = []
+            for value in (display_title, song.name, song.relative_path):
+                norm = _normalize_for_search(value)
+                fields.append((norm, _char_mask(norm)))
+            self._search_index.append((song, tuple(fields)))
+
             # Split path into parts
             parts = song.relative_path.replace("\\", "/").split("/")
 
             # Create folder nodes
-            current_path = ""
-            parent_item = None
+            path_key = ()
+            siblings = top_level_items
 
-            for i, part in enumerate(parts[:-1]):
-                current_path = f"{current_path}/{part}" if current_path else part
+            for part in parts[:-1]:
+                path_key = path_key + (part,)
 
-                if current_path not in folder_items:
+                if path_key not in folder_items:
                     folder_item = QTreeWidgetItem()
                     folder_item.setText(0, part)
                     folder_item.setData(0, Qt.ItemDataRole.UserRole, None)  # Not a song
+                    siblings.append(folder_item)
 
-                    if parent_item:
-                        parent_item.addChild(folder_item)
-                    else:
-                        self.tree.addTopLevelItem(folder_item)
-
-                    folder_items[current_path] = folder_item
+                    folder_items[path_key] = folder_item
+                    folder_children[path_key] = []
 
-                parent_item = folder_items[current_path]
+                siblings = folder_children[path_key]
 
             # Create song node
             song_item = QTreeWidgetItem()
-            display_text = self._format_song_display(song)
+            display_text = self._format_song_display(song, display_title)
             song_item.setText(0, display_text)
             song_item.setData(0, Qt.ItemDataRole.UserRole, song)
-
-            if parent_item:
-                parent_item.addChild(song_item)
-            else:
-                self.tree.addTopLevelItem(song_item)
+            siblings.append(song_item)
 
             self._song_items[song.relative_path] = song_item
 
+        for path_key, children in folder_children.items():
+            folder_items[path_key].addChildren(children)
+        self.tree.addTopLevelItems(top_level_items)
+
         # Expand all folders
         self.tree.expandAll()
 
-    def _format_song_display(self, song: Song) -> str:
-        """Format song display text with status indicators."""
+    def _format_song_display(self, song: Song, display_title: Optional[str] = None) -> str:
+        """Format song display text with status indicators.
+
+        display_title may be passed when the caller already read it from the song.
+        """
         indicators = []
 
         if song.has_pptx:
@@ -202,85 +289,133 @@ class SongPickerDialog(QDialog):
 
         status = " ".join(indicators)
         # Use display_title which prefers song.properties title over folder name
-        return f"{song.display_title}  {status}"
+        if display_title is None:
+            display_title = song.display_title
+        return f"{display_title}  {status}"
 
     def _connect_signals(self) -> None:
         """Connect widget signals."""
-        self.search_input.textChanged.connect(self._on_search_text_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._apply_filter)
         self.tree.itemSelectionChanged.connect(self._on_selection_changed)
         self.tree.itemDoubleClicked.connect(self._on_double_click)
+        self.results_list.itemSelectionChanged.connect(self._on_selection_changed)
+        self.results_list.itemDoubleClicked.connect(self._on_result_double_click)
+        self._thumb_signals.finished.connect(self._on_thumbnail_loaded)
         self.browse_button.clicked.connect(self._on_browse_file)
         self.stub_button.clicked.connect(self._on_create_stub)
         self.create_new_button.clicked.connect(self._on_create_new_song)
         self.button_box.accepted.connect(self.accept)
         self.button_box.rejected.connect(self.reject)
 
-    def _on_search_text_changed(self, text: str) -> None:
-        """Filter songs based on search text using fuzzy multilingual matching."""
+    def _apply_filter(self) -> None:
+        """Filter songs based on search text using fuzzy multilingual matching.
+
+        For queries shorter than MIN_SEARCH_LENGTH the folder tree is shown;
+        otherwise the matching songs are listed flat, best match first.
+        """
         # Minimum score to consider a match (0.0 to 1.0)
         min_score = 0.3
 
-        def get_match_score(song: Song) -> float:
-            """Get best fuzzy match score for a song across all searchable fields."""
-            if not text:
-                return 1.0
-
-            # Check multiple fields and return best score
-            scores = [
-                _fuzzy_match(text, song.display_title),
-                _fuzzy_match(text, song.name),
-                _fuzzy_match(text, song.relative_path),
-            ]
-            return max(scores)
-
-        def set_item_visibility(item: QTreeWidgetItem) -> bool:
-            """Recursively set visibility. Returns True if item or any child is visible."""
-            song = item.data(0, Qt.ItemDataRole.UserRole)
-
-            if song is not None:
-                # This is a song item - use fuzzy matching
-                score = get_match_score(song)
-                visible = score >= min_score
-                item.setHidden(not visible)
-                return visible
-            else:
-                # This is a folder item
-                any_child_visible = False
-                for i in range(item.childCount()):
-                    child = item.child(i)
-                    if set_item_visibility(child):
-                        any_child_visible = True
-
-                item.setHidden(not any_child_visible)
-                return any_child_visible
-
-        # Process all top-level items
-        for i in range(self.tree.topLevelItemCount()):
-            item = self.tree.topLevelItem(i)
-            set_item_visibility(item)
-
-        # Expand all visible folders
-        if text:
-            self.tree.expandAll()
+        query_norm = _normalize_for_search(self.search_input.text())
+        if len(query_norm) < MIN_SEARCH_LENGTH:
+            self._show_view(self.tree)
+            return
 
-    def _on_selection_changed(self) -> None:
-        """Handle selection change in tree."""
-        selected_items = self.tree.selectedItems()
+        # A field scores at least min_score only if it contains every query
+        # character, so fields missing one are rejected without scoring
+        query_mask = _char_mask(query_norm)
+        results = []
+        for song, fields in self._search_index:
+            score = max(
+                (
+                    fuzzy_match_normalized(query_norm, norm)
+                    for norm, mask in fields
+                    if mask & query_mask == query_mask
+                ),
+                default=0.0,
+            )
+            if score >= min_score:
+                results.append((score, song))
+        results = heapq.nlargest(MAX_SEARCH_RESULTS, results, key=lambda result: result[0])
+        result_songs = [song for _, song in results]
+
+        # Typing often narrows a query without changing the matches; only
+        # rebuild the list when they differ
+        if result_songs != self._result_songs:
+            self._result_songs = result_songs
+            self.results_list.setUpdatesEnabled(False)
+            self.results_list.blockSignals(True)
+            try:
+                self.results_list.clear()
+                for song in result_songs:
+                    item = QListWidgetItem(self._song_items[song.relative_path].text(0))
+                    item.setToolTip(song.relative_path)
+                    item.setData(Qt.ItemDataRole.UserRole, song)
+                    self.results_list.addItem(item)
+            finally:
+                self.results_list.blockSignals(False)
+                self.results_list.setUpdatesEnabled(True)
+
+        self._show_view(self.results_list)
+
+    def _show_view(self, view) -> None:
+        """Show the tree or the results list, keeping the selected song selected."""
+        self.view_stack.setCurrentWidget(view)
+
+        view.blockSignals(True)
+        try:
+            view.clearSelection()
+            item = self._find_view_item(view, self._selected_song)
+            if item is not None:
+                view.setCurrentItem(item)
+                view.scrollToItem(item)
+        finally:
+            view.blockSignals(False)
+
+        if self._selected_song is not None and not view.selectedItems():
+            # The selected song is not among the results
+            self._on_selection_changed()
+
+    def _find_view_item(self, view, song: Optional[Song]):
+        """Find the item showing a song in the tree or the results list."""
+        if song is None:
+            return None
+        if view is self.tree:
+            return self._song_items.get(song.relative_path)
+        for row in range(self.results_list.count()):
+            item = self.results_list.item(row)
+            if item.data(Qt.ItemDataRole.UserRole) is song:
+                return item
+        return None
 
-        if selected_items:
-            item = selected_items[0]
-            song = item.data(0, Qt.ItemDataRole.UserRole)
+    def _clear_song_selection(self) -> None:
+        """Clear the song selection in both the tree and the results list.
 
-            if song is not None:
-                self._selected_song = song
-                self._stub_title = None
-                self._external_path = None
-                self._external_title = None
-                self._update_info_label(song)
-                self.status_label.clear()
-            else:
-                self._selected_song = None
-                self.info_label.setText("")
+        Callers reset the selection state themselves, so no selection
+        change is reported.
+        """
+        for view in (self.tree, self.results_list):
+            view.blockSignals(True)
+            view.clearSelection()
+            view.blockSignals(False)
+
+    def _on_selection_changed(self) -> None:
+        """Handle selection change in the tree or results list."""
+        if self.view_stack.currentWidget() is self.results_list:
+            selected_items = self.results_list.selectedItems()
+            song = selected_items[0].data(Qt.ItemDataRole.UserRole) if selected_items else None
+        else:
+            selected_items = self.tree.selectedItems()
+            song = selected_items[0].data(0, Qt.ItemDataRole.UserRole) if selected_items else None
+
+        if song is not None:
+            self._selected_song = song
+            self._stub_title = None
+            self._external_path = None
+            self._external_title = None
+            self._update_info_label(song)
+            self.status_label.clear()
         else:
             self._selected_song = None
             self.info_label.setText("")
@@ -313,32 +448,63 @@ class SongPickerDialog(QDialog):
 
     def _update_thumbnail(self, song: Song) -> None:
         """Update the thumbnail preview for a song."""
-        if not self.pptx_service or not song.has_pptx:
+        cache_key = self._thumbnail_cache_key(song.pptx_path) if self.pptx_service else None
+        if cache_key is None:
             self.thumbnail_label.setPixmap(QPixmap())
             self.thumbnail_label.setText(tr("dialog.song.no_preview"))
             return
 
-        # Try to get thumbnail from pptx
-        thumb_data = self.pptx_service.get_thumbnail(song.pptx_path)
-        if thumb_data:
-            pixmap = QPixmap()
-            pixmap.loadFromData(thumb_data)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.thumbnail_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.thumbnail_label.setPixmap(scaled)
-                self.thumbnail_label.setText("")
-                return
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None:
+            self.thumbnail_label.setPixmap(pixmap)
+            self.thumbnail_label.setText("")
+            return
 
+        # Read the thumbnail in background; the label stays empty meanwhile
         self.thumbnail_label.setPixmap(QPixmap())
-        self.thumbnail_label.setText(tr("dialog.song.no_preview"))
+        self.thumbnail_label.setText("")
+        self._thread_pool.start(SongThumbnailRunnable(
+            self.pptx_service, self._thumb_signals, song.pptx_path, cache_key,
+            self.thumbnail_label.size(), self.devicePixelRatioF()
+        ))
+
+    @staticmethod
+    def _thumbnail_cache_key(pptx_path: Optional[str]) -> Optional[str]:
+        """Get the QPixmapCache key for a song thumbnail, or None if the file is missing."""
+        if not pptx_path:
+            return None
+        try:
+            mtime = os.path.getmtime(pptx_path)
+        except OSError:
+            return None
+        return f"song:{pptx_path}:{mtime}"
+
+    def _on_thumbnail_loaded(self, pptx_path: str, cache_key: str, image: QImage) -> None:
+        """Cache a loaded thumbnail and show it if its song is still selected."""
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else None
+        if pixmap is not None:
+            QPixmapCache.insert(cache_key, pixmap)
+
+        if self._selected_song is None or self._selected_song.pptx_path != pptx_path:
+            return
+
+        if pixmap is not None:
+            self.thumbnail_label.setPixmap(pixmap)
+            self.thumbnail_label.setText("")
+        else:
+            self.thumbnail_label.setPixmap(QPixmap())
+            self.thumbnail_label.setText(tr("dialog.song.no_preview"))
 
     def _on_double_click(self, item: QTreeWidgetItem, column: int) -> None:
         """Handle double-click on item."""
-        song = item.data(0, Qt.ItemDataRole.UserRole)
+        self._accept_song(item.data(0, Qt.ItemDataRole.UserRole))
+
+    def _on_result_double_click(self, item: QListWidgetItem) -> None:
+        """Handle double-click on a search result."""
+        self._accept_song(item.data(Qt.ItemDataRole.UserRole))
+
+    def _accept_song(self, song: Optional[Song]) -> None:
+        """Accept the dialog with the given song, if it is a song."""
         if song is not None:
             self._selected_song = song
             self._stub_title = None
@@ -357,7 +523,6 @@ class SongPickerDialog(QDialog):
 
         if file_path:
             # Ask for a title for this external song
-            import os
             default_title = os.path.splitext(os.path.basename(file_path))[0]
 
             title, ok = QInputDialog.getText(
@@ -372,7 +537,7 @@ class SongPickerDialog(QDialog):
                 self._external_title = title.strip()
                 self._selected_song = None
                 self._stub_title = None
-                self.tree.clearSelection()
+                self._clear_song_selection()
 
                 self.status_label.setText(tr("dialog.song.external_selected", title=self._external_title))
                 self.info_label.clear()
@@ -391,7 +556,7 @@ class SongPickerDialog(QDialog):
             self._selected_song = None
             self._external_path = None
             self._external_title = None
-            self.tree.clearSelection()
+            self._clear_song_selection()
 
             self.status_label.setText(tr("dialog.song.stub_selected", title=self._stub_title))
             self.info_label.clear()
@@ -420,6 +585,11 @@ class SongPickerDialog(QDialog):
         self._new_song_created = True
         self._populate_tree()
 
+        # Show the full tree so the new song is visible
+        self.search_input.clear()
+        self._search_timer.stop()
+        self._show_view(self.tree)
+
         # Select the newly created song
         if new_song.relative_path in self._song_items:
             item = self._song_items[new_song.relative_path]
@@ -1,7 +1,7 @@
 """Dialog for selecting sections/slides from theme PPTX files."""
 
 import os
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from PyQt6.QtWidgets import (
     QDialog,
@@ -19,7 +19,8 @@ from PyQt6.QtWidgets import (
     QCheckBox,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QStandardItem, QStandardItemModel
 
 from ..models import (
     LiturgySection,
@@ -30,6 +31,14 @@ from ..models import (
 from ..services import ThemeService
 from ..i18n import tr
 
+# Delay (ms) that collapses fast typing into a single filter pass
+SEARCH_DEBOUNCE_MS = 150
+
+# Item data roles for theme tree items
+ITEM_TYPE_ROLE = Qt.ItemDataRole.UserRole  # int: one of the ITEM_TYPE_* values
+PAYLOAD_ROLE = Qt.ItemDataRole.UserRole + 1  # LiturgySection or LiturgySlide
+PARENT_SECTION_ROLE = Qt.ItemDataRole.UserRole + 2  # LiturgySection: parent of a slide
+
 
 class ThemeSectionPicker(QDialog):
     """Dialog for selecting sections from theme PPTX files."""
@@ -43,17 +52,27 @@ class ThemeSectionPicker(QDialog):
         settings: Settings,
         base_path: str,
         existing_sections: List[LiturgySection] = None,
+        theme_service: Optional[ThemeService] = None,
         parent=None
     ):
         super().__init__(parent)
         self.settings = settings
         self.base_path = base_path
-        self.theme_service = ThemeService(settings, base_path)
+        # A shared service keeps its parsed theme outlines across dialog openings
+        self.theme_service = theme_service or ThemeService(settings, base_path)
         self.existing_sections = existing_sections or []
 
         self._selected_sections: List[LiturgySection] = []
         self._add_to_existing: Optional[str] = None  # Section ID to add slides to
 
+        # (item, parent section item or None, casefolded name) for every tree item
+        self._search_index: List[Tuple[QTreeWidgetItem, Optional[QTreeWidgetItem], str]] = []
+        self._visible_entries = self._search_index  # Index entries left visible by the filter
+        self._last_query = ""
+        # (item type, section or slide, parent section or None) by id(item), so
+        # selection handling does not read item data back through Qt
+        self._item_meta: Dict[int, Tuple[int, Any, Optional[LiturgySection]]] = {}
+
         self._setup_ui()
         self._populate_themes()
         self._connect_signals()
@@ -96,6 +115,8 @@ class ThemeSectionPicker(QDialog):
         self.tree_widget.setHeaderHidden(True)
         self.tree_widget.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
         self.tree_widget.setAlternatingRowColors(True)
+        # All rows are single-line, so Qt can skip measuring each one
+        self.tree_widget.setUniformRowHeights(True)
         layout.addWidget(self.tree_widget)
 
         # Add to options
@@ -111,9 +132,13 @@ class ThemeSectionPicker(QDialog):
         self.existing_combo = QComboBox()
         self.existing_combo.setEnabled(False)
 
-        # Populate existing sections
+        # Populate existing sections, filling the model before the combo uses it
+        existing_model = QStandardItemModel(self.existing_combo)
         for section in self.existing_sections:
-            self.existing_combo.addItem(section.name, section.id)
+            item = QStandardItem(section.name)
+            item.setData(section.id, Qt.ItemDataRole.UserRole)
+            existing_model.appendRow(item)
+        self.existing_combo.setModel(existing_model)
 
         existing_layout.addWidget(self.existing_section_radio)
         existing_layout.addWidget(self.existing_combo, 1)
@@ -134,6 +159,11 @@ class ThemeSectionPicker(QDialog):
         self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
         layout.addWidget(self.button_box)
 
+        # Filter once typing pauses instead of on every keystroke
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+
     def _populate_themes(self) -> None:
         """Populate the theme combo box."""
         theme_files = self.theme_service.get_theme_files()
@@ -149,7 +179,8 @@ class ThemeSectionPicker(QDialog):
         """Connect widget signals."""
         self.theme_combo.currentIndexChanged.connect(self._on_theme_changed)
         self.browse_theme_btn.clicked.connect(self._on_browse_theme)
-        self.search_input.textChanged.connect(self._on_search_changed)
+        self.search_input.textChanged.connect(self._search_timer.start)
+        self._search_timer.timeout.connect(self._apply_filter)
         self.tree_widget.itemSelectionChanged.connect(self._on_selection_changed)
         self.tree_widget.itemDoubleClicked.connect(self._on_double_click)
 
@@ -187,37 +218,54 @@ class ThemeSectionPicker(QDialog):
     def _load_theme(self, theme_path: str) -> None:
         """Load sections from a theme file into the tree."""
         self.tree_widget.clear()
+        self._search_index = []
+        self._visible_entries = self._search_index
+        self._item_meta = {}
+        self._last_query = ""
 
         try:
             sections = self.theme_service.get_sections_from_theme(theme_path)
 
+            # Build the items first and attach them in one call per parent,
+            # rather than inserting them into the live tree one by one
+            section_items = []
             for section in sections:
                 section_item = QTreeWidgetItem()
                 section_item.setText(0, f"📁 {section.name}")
-                section_item.setData(0, Qt.ItemDataRole.UserRole, self.ITEM_TYPE_SECTION)
-                section_item.setData(0, Qt.ItemDataRole.UserRole + 1, section)
+                section_item.setData(0, ITEM_TYPE_ROLE, self.ITEM_TYPE_SECTION)
+                section_item.setData(0, PAYLOAD_ROLE, section)
                 section_item.setFlags(
                     Qt.ItemFlag.ItemIsEnabled |
                     Qt.ItemFlag.ItemIsSelectable
                 )
-
-                self.tree_widget.addTopLevelItem(section_item)
+                self._search_index.append((section_item, None, section.name.casefold()))
+                self._item_meta[id(section_item)] = (self.ITEM_TYPE_SECTION, section, None)
 
                 # Add slides as children
+                slide_items = []
                 for slide in section.slides:
                     slide_item = QTreeWidgetItem()
                     slide_item.setText(0, f"  └─ {slide.title}")
-                    slide_item.setData(0, Qt.ItemDataRole.UserRole, self.ITEM_TYPE_SLIDE)
-                    slide_item.setData(0, Qt.ItemDataRole.UserRole + 1, slide)
-                    slide_item.setData(0, Qt.ItemDataRole.UserRole + 2, section)  # Parent section
+                    slide_item.setData(0, ITEM_TYPE_ROLE, self.ITEM_TYPE_SLIDE)
+                    slide_item.setData(0, PAYLOAD_ROLE, slide)
+                    slide_item.setData(0, PARENT_SECTION_ROLE, section)
                     slide_item.setFlags(
                         Qt.ItemFlag.ItemIsEnabled |
                         Qt.ItemFlag.ItemIsSelectable
                     )
+                    self._search_index.append((slide_item, section_item, slide.title.casefold()))
+                    self._item_meta[id(slide_item)] = (self.ITEM_TYPE_SLIDE, slide, section)
+                    slide_items.append(slide_item)
 
-                    section_item.addChild(slide_item)
+                section_item.addChildren(slide_items)
+                section_items.append(section_item)
 
-                section_item.setExpanded(True)
+            self.tree_widget.setUpdatesEnabled(False)
+            try:
+                self.tree_widget.addTopLevelItems(section_items)
+                self.tree_widget.expandAll()
+            finally:
+                self.tree_widget.setUpdatesEnabled(True)
 
         except Exception as e:
             QMessageBox.warning(
@@ -226,35 +274,72 @@ class ThemeSectionPicker(QDialog):
                 tr("error.load_failed", error=str(e))
             )
 
-    def _on_search_changed(self, text: str) -> None:
-        """Filter tree items based on search text."""
-        search_lower = text.lower()
-
-        for i in range(self.tree_widget.topLevelItemCount()):
-            section_item = self.tree_widget.topLevelItem(i)
-            section_visible = search_lower in section_item.text(0).lower()
-
-            # Check children
-            child_visible = False
-            for j in range(section_item.childCount()):
-                child = section_item.child(j)
-                if search_lower in child.text(0).lower():
-                    child_visible = True
-                    child.setHidden(False)
+    def _apply_filter(self) -> None:
+        """Filter tree items based on search text.
+
+        Every word of the query must occur in a name or title for it to match.
+        A section stays visible when its name or one of its slide titles
+        matches; slides are visible when they or their section match.
+        """
+        query = self.search_input.text().casefold()
+        terms = query.split()
+
+        if not terms:
+            # Everything is visible again; nothing is hidden after an empty query
+            if self._last_query:
+                self.tree_widget.setUpdatesEnabled(False)
+                try:
+                    for item, _, _ in self._search_index:
+                        item.setHidden(False)
+                finally:
+                    self.tree_widget.setUpdatesEnabled(True)
+                self._visible_entries = self._search_index
+                self._last_query = ""
+            return
+
+        # A longer query only hides more: items hidden for the previous query
+        # stay hidden, so only the visible ones need to be checked again
+        if query.startswith(self._last_query):
+            entries = self._visible_entries
+        else:
+            entries = self._search_index
+        self._last_query = query
+
+        matched = set()  # ids of items whose own text matches
+        sections_with_match = set()  # ids of sections with a matching slide
+        for item, section_item, text in entries:
+            if all(term in text for term in terms):
+                matched.add(id(item))
+                if section_item is not None:
+                    sections_with_match.add(id(section_item))
+
+        # Lay the tree out once after all items are shown or hidden
+        visible_entries = []
+        self.tree_widget.setUpdatesEnabled(False)
+        try:
+            for entry in entries:
+                item, section_item, _ = entry
+                if section_item is None:
+                    visible = id(item) in matched or id(item) in sections_with_match
                 else:
-                    child.setHidden(not section_visible)
-
-            section_item.setHidden(not (section_visible or child_visible))
+                    visible = id(item) in matched or id(section_item) in matched
+                item.setHidden(not visible)
+                if visible:
+                    visible_entries.append(entry)
+        finally:
+            self.tree_widget.setUpdatesEnabled(True)
+        self._visible_entries = visible_entries
 
     def _on_selection_changed(self) -> None:
         """Handle selection change."""
         selected = self.tree_widget.selectedItems()
+        item_meta = self._item_meta
 
         section_count = 0
         slide_count = 0
 
         for item in selected:
-            item_type = item.data(0, Qt.ItemDataRole.UserRole)
+            item_type = item_meta[id(item)][0]
             if item_type == self.ITEM_TYPE_SECTION:
                 section_count += 1
             elif item_type == self.ITEM_TYPE_SLIDE:
@@ -278,7 +363,7 @@ class ThemeSectionPicker(QDialog):
 
     def _on_double_click(self, item: QTreeWidgetItem, column: int) -> None:
         """Handle double-click to accept selection."""
-        if item.data(0, Qt.ItemDataRole.UserRole) in (self.ITEM_TYPE_SECTION, self.ITEM_TYPE_SLIDE):
+        if self._item_meta[id(item)][0] in (self.ITEM_TYPE_SECTION, self.ITEM_TYPE_SLIDE):
             self.accept()
 
     def _on_add_option_changed(self, checked: bool) -> None:
@@ -293,16 +378,15 @@ class ThemeSectionPicker(QDialog):
 
     def get_selected_sections(self) -> List[LiturgySection]:
         """Get the selected sections (new sections or with slides added)."""
-        selected = self.tree_widget.selectedItems()
         result_sections = []
-        slides_to_add = []  # For adding to existing section
-
-        # First pass: collect all selected sections
         selected_section_ids = set()
-        for item in selected:
-            item_type = item.data(0, Qt.ItemDataRole.UserRole)
+        pending_slides = []  # (slide, parent section), in selection order
+        item_meta = self._item_meta
+
+        for item in self.tree_widget.selectedItems():
+            item_type, payload, parent_section = item_meta[id(item)]
             if item_type == self.ITEM_TYPE_SECTION:
-                section: LiturgySection = item.data(0, Qt.ItemDataRole.UserRole + 1)
+                section: LiturgySection = payload
                 # Deep copy the section
                 new_section = LiturgySection(
                     name=section.name,
@@ -311,31 +395,25 @@ class ThemeSectionPicker(QDialog):
                     slides=list(section.slides),
                 )
                 result_sections.append(new_section)
-                selected_section_ids.add(id(section))
-
-        # Second pass: collect individual slides not part of selected sections
-        for item in selected:
-            item_type = item.data(0, Qt.ItemDataRole.UserRole)
-            if item_type == self.ITEM_TYPE_SLIDE:
-                slide: LiturgySlide = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                parent_section: LiturgySection = item.data(0, Qt.ItemDataRole.UserRole + 2)
-
-                # Skip if parent section is already selected
-                if id(parent_section) in selected_section_ids:
-                    continue
-
-                if self.existing_section_radio.isChecked():
-                    # Collect for adding to existing section
-                    slides_to_add.append(slide)
-                else:
-                    # Create new section for individual slide
-                    new_section = LiturgySection(
-                        name=slide.title,
-                        section_type=SectionType.REGULAR,
-                        source_theme_path=parent_section.source_theme_path,
-                        slides=[slide],
-                    )
-                    result_sections.append(new_section)
+                selected_section_ids.add(section.id)
+            elif item_type == self.ITEM_TYPE_SLIDE:
+                pending_slides.append((payload, parent_section))
+
+        # Slides added to an existing section are returned by get_slides_for_existing
+        if self.existing_section_radio.isChecked():
+            return result_sections
+
+        # Create a new section for each individual slide not part of a selected section
+        for slide, parent_section in pending_slides:
+            if parent_section.id in selected_section_ids:
+                continue
+            new_section = LiturgySection(
+                name=slide.title,
+                section_type=SectionType.REGULAR,
+                source_theme_path=parent_section.source_theme_path,
+                slides=[slide],
+            )
+            result_sections.append(new_section)
 
         return result_sections
 
@@ -349,16 +427,15 @@ class ThemeSectionPicker(QDialog):
             return (None, [])
 
         selected = self.tree_widget.selectedItems()
+        item_meta = self._item_meta
         slides = []
 
         for item in selected:
-            item_type = item.data(0, Qt.ItemDataRole.UserRole)
+            item_type, payload, _ = item_meta[id(item)]
             if item_type == self.ITEM_TYPE_SLIDE:
-                slide: LiturgySlide = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                slides.append(slide)
+                slides.append(payload)
             elif item_type == self.ITEM_TYPE_SECTION:
-                section: LiturgySection = item.data(0, Qt.ItemDataRole.UserRole + 1)
-                slides.extend(section.slides)
+                slides.extend(payload.slides)
 
         return (section_id, slides)
 
@@ -0,0 +1,148 @@
+"""Background workers and install handling shared by the YouTube dialogs."""
+
+import subprocess
+import sys
+import threading
+from typing import List
+
+from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from ..services import YouTubeService
+
+
+class SearchSignals(QObject):
+    """Signals for YouTube search worker."""
+    finished = pyqtSignal(list, int)  # (results, request_id)
+    error = pyqtSignal(str, int)  # (error_message, request_id)
+
+
+class SearchRunnable(QRunnable):
+    """Runnable for YouTube search in background."""
+
+    def __init__(self, youtube_service: YouTubeService, query: str, request_id: int):
+        super().__init__()
+        self.youtube_service = youtube_service
+        self.query = query
+        self.request_id = request_id
+        self.signals = SearchSignals()
+        self.cancelled = False
+
+    def run(self):
+        if self.cancelled:
+            return
+        try:
+            results = self.youtube_service.search(self.query, max_results=10)
+            if not self.cancelled:
+                self.signals.finished.emit(results, self.request_id)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.error.emit(str(e), self.request_id)
+
+
+class PipInstallSignals(QObject):
+    """Signals for yt-dlp install worker."""
+    progress = pyqtSignal(str)  # output line
+    finished = pyqtSignal(bool, str)  # success, error message
+
+
+class PipInstallRunnable(QRunnable):
+    """Runnable that installs yt-dlp with pip, reporting pip's output as it runs."""
+
+    TIMEOUT = 120  # seconds
+
+    def __init__(self):
+        super().__init__()
+        self.signals = PipInstallSignals()
+
+    def run(self):
+        try:
+            process = subprocess.Popen(
+                [sys.executable, "-m", "pip", "install", "yt-dlp"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+            )
+        except Exception as e:
+            self.signals.finished.emit(False, f"Installation error: {str(e)}")
+            return
+
+        # Kill pip if it hangs; reading its output would otherwise block forever
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(self.TIMEOUT, kill)
+        timer.start()
+        output: List[str] = []
+        try:
+            for raw_line in process.stdout:
+                line = raw_line.decode("utf-8", "replace").rstrip()
+                if line:
+                    output.append(line)
+                    self.signals.progress.emit(line)
+            process.wait()
+        finally:
+            timer.cancel()
+            process.stdout.close()
+
+        if timed_out.is_set():
+            self.signals.finished.emit(
+                False, "Installation timed out. Please try again or install manually."
+            )
+        elif process.returncode == 0:
+            self.signals.finished.emit(True, "")
+        else:
+            error = "\n".join(output)[-200:] or "Unknown error"
+            self.signals.finished.emit(False, f"Installation failed: {error}")
+
+
+class YtDlpInstallMixin:
+    """Installs yt-dlp from a dialog that shows YouTube search results.
+
+    The dialog provides youtube_service, install_button, warning_label,
+    search_button, results_label and results_list, and initializes
+    _install_worker to None.
+    """
+
+    def _install_ytdlp(self) -> None:
+        """Install yt-dlp package in background."""
+        self.install_button.setEnabled(False)
+        self.install_button.setText("Installing...")
+        self.warning_label.setText("Installing yt-dlp, please wait...")
+
+        self._install_worker = PipInstallRunnable()
+        self._install_worker.signals.progress.connect(self.warning_label.setText)
+        self._install_worker.signals.finished.connect(self._on_install_finished)
+        QThreadPool.globalInstance().start(self._install_worker)
+
+    def _on_install_finished(self, success: bool, error: str) -> None:
+        """Handle completion of the yt-dlp installation."""
+        self._install_worker = None
+        if success:
+            # Reset the yt-dlp availability check
+            self.youtube_service._yt_dlp_available = None
+
+            if self.youtube_service.is_yt_dlp_available():
+                self.warning_label.setText("yt-dlp installed successfully!")
+                self.install_button.setVisible(False)
+                self.search_button.setEnabled(True)
+                self.results_label.setVisible(True)
+                self.results_list.setVisible(True)
+
+                QMessageBox.information(
+                    self,
+                    "Installation Complete",
+                    "yt-dlp has been installed. You can now search for YouTube videos."
+                )
+            else:
+                self.warning_label.setText(
+                    "Installation completed but yt-dlp is still not available. "
+                    "Please restart the application."
+                )
+                self.install_button.setText("Installed - Restart app")
+        else:
+            self.warning_label.setText(error)
+            self.install_button.setEnabled(True)
+            self.install_button.setText("Retry installation")
@@ -1,7 +1,5 @@
 """Dialog for searching and selecting YouTube videos."""
 
-import subprocess
-import sys
 from typing import List, Optional
 
 from PyQt6.QtWidgets import (
@@ -15,34 +13,15 @@ from PyQt6.QtWidgets import (
     QLabel,
     QDialogButtonBox,
     QProgressBar,
-    QMessageBox,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThreadPool
 
 from ..services import YouTubeService, YouTubeResult
 from ..i18n import tr
+from .workers import PipInstallRunnable, SearchRunnable, YtDlpInstallMixin
 
 
-class SearchWorker(QThread):
-    """Worker thread for YouTube search."""
-
-    finished = pyqtSignal(list)
-    error = pyqtSignal(str)
-
-    def __init__(self, youtube_service: YouTubeService, query: str):
-        super().__init__()
-        self.youtube_service = youtube_service
-        self.query = query
-
-    def run(self):
-        try:
-            results = self.youtube_service.search(self.query, max_results=10)
-            self.finished.emit(results)
-        except Exception as e:
-            self.error.emit(str(e))
-
-
-class YouTubeDialog(QDialog):
+class YouTubeDialog(YtDlpInstallMixin, QDialog):
     """Dialog for searching and selecting YouTube videos for a song."""
 
     def __init__(self, song_title: str, youtube_service: YouTubeService, parent=None):
@@ -50,7 +29,9 @@ class YouTubeDialog(QDialog):
         self.song_title = song_title
         self.youtube_service = youtube_service
         self._selected_urls: List[str] = []
-        self._worker: Optional[SearchWorker] = None
+        self._worker: Optional[SearchRunnable] = None
+        self._search_request_id: int = 0
+        self._install_worker: Optional[PipInstallRunnable] = None
         self._results: List[YouTubeResult] = []
 
         self._setup_ui()
@@ -149,14 +130,19 @@ class YouTubeDialog(QDialog):
         self.results_list.clear()
         self.search_button.setEnabled(False)
 
-        # Start search worker
-        self._worker = SearchWorker(self.youtube_service, query)
-        self._worker.finished.connect(self._on_search_finished)
-        self._worker.error.connect(self._on_search_error)
-        self._worker.start()
+        # Start search in background; a newer search supersedes a running one
+        if self._worker:
+            self._worker.cancelled = True
+        self._search_request_id += 1
+        self._worker = SearchRunnable(self.youtube_service, query, self._search_request_id)
+        self._worker.signals.finished.connect(self._on_search_finished)
+        self._worker.signals.error.connect(self._on_search_error)
+        QThreadPool.globalInstance().start(self._worker)
 
-    def _on_search_finished(self, results: List[YouTubeResult]) -> None:
+    def _on_search_finished(self, results: List[YouTubeResult], request_id: int) -> None:
         """Handle search completion."""
+        if request_id != self._search_request_id:
+            return  # Stale result from a superseded search
         self.progress_label.setVisible(False)
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
@@ -168,14 +154,20 @@ class YouTubeDialog(QDialog):
             self.no_results_label.setVisible(True)
             return
 
-        for result in results:
-            item = QListWidgetItem()
-            item.setText(f"{result.title}\n  {result.channel} - {result.duration}")
-            item.setData(Qt.ItemDataRole.UserRole, result)
-            self.results_list.addItem(item)
-
-    def _on_search_error(self, error: str) -> None:
+        # Lay the list out once, after all results are added
+        self.results_list.setUpdatesEnabled(False)
+        try:
+            for result in results:
+                item = QListWidgetItem(f"{result.title}\n  {result.channel} - {result.duration}")
+                item.setData(Qt.ItemDataRole.UserRole, result)
+                self.results_list.addItem(item)
+        finally:
+            self.results_list.setUpdatesEnabled(True)
+
+    def _on_search_error(self, error: str, request_id: int) -> None:
         """Handle search error."""
+        if request_id != self._search_request_id:
+            return
         self.progress_label.setVisible(False)
         self.progress_bar.setVisible(False)
         self.search_button.setEnabled(True)
@@ -227,60 +219,3 @@ class YouTubeDialog(QDialog):
         # Insert before button box
         layout = self.layout()
         layout.insertWidget(layout.count() - 1, self.install_button)
-
-    def _install_ytdlp(self) -> None:
-        """Install yt-dlp package."""
-        self.install_button.setEnabled(False)
-        self.install_button.setText("Installing...")
-        self.warning_label.setText("Installing yt-dlp, please wait...")
-
-        # Force UI update
-        from PyQt6.QtWidgets import QApplication
-        QApplication.processEvents()
-
-        try:
-            # Install yt-dlp using pip
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "install", "yt-dlp"],
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-
-            if result.returncode == 0:
-                # Reset the yt-dlp availability check
-                self.youtube_service._yt_dlp_available = None
-
-                if self.youtube_service.is_yt_dlp_available():
-                    self.warning_label.setText("yt-dlp installed successfully!")
-                    self.install_button.setVisible(False)
-                    self.search_button.setEnabled(True)
-                    self.results_label.setVisible(True)
-                    self.results_list.setVisible(True)
-
-                    QMessageBox.information(
-                        self,
-                        "Installation Complete",
-                        "yt-dlp has been installed. You can now search for YouTube videos."
-                    )
-                else:
-                    self.warning_label.setText(
-                        "Installation completed but yt-dlp is still not available. "
-                        "Please restart the application."
-                    )
-                    self.install_button.setText("Installed - Restart app")
-            else:
-                self.warning_label.setText(
-                    f"Installation failed: {result.stderr[:200] if result.stderr else 'Unknown error'}"
-                )
-                self.install_button.setEnabled(True)
-                self.install_button.setText("Retry installation")
-
-        except subprocess.TimeoutExpired:
-            self.warning_label.setText("Installation timed out. Please try again or install manually.")
-            self.install_button.setEnabled(True)
-            self.install_button.setText("Retry installation")
-        except Exception as e:
-            self.warning_label.setText(f"Installation error: {str(e)}")
-            self.install_button.setEnabled(True)
-            self.install_button.setText("Retry installation")